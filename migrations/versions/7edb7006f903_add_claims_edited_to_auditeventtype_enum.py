@@ -19,7 +19,10 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.execute("ALTER TYPE auditeventtype ADD VALUE IF NOT EXISTS 'CLAIMS_EDITED' BEFORE 'MATTER_LOCKED'")
+    # Outside the migration transaction for PG versions where ADD VALUE
+    # rejects transaction blocks
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE auditeventtype ADD VALUE IF NOT EXISTS 'CLAIMS_EDITED' BEFORE 'MATTER_LOCKED'")
 
 
 def downgrade() -> None:
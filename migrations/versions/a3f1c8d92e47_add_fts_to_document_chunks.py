@@ -21,40 +21,23 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add full-text search support to document_chunks."""
-    # 1. Add tsvector column
-    op.add_column('document_chunks', sa.Column('search_vector', TSVECTOR, nullable=True))
-
-    # 2. Create GIN index for fast full-text search
+    # 1. Add tsvector as a STORED generated column: evaluated in C at
+    #    heap_insert time, so no trigger dispatch or plpgsql interpretation
+    #    per row, and existing rows are materialized on ADD COLUMN. This also
+    #    supersedes the old table-wide backfill UPDATE: the single heap
+    #    rewrite here replaces one UPDATE row-version per row plus its WAL.
     op.execute(
-        'CREATE INDEX ix_document_chunks_search ON document_chunks USING GIN(search_vector)'
+        "ALTER TABLE document_chunks ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', content)) STORED"
     )
 
-    # 3. Backfill existing rows
+    # 2. Create GIN index for fast full-text search
     op.execute(
-        "UPDATE document_chunks SET search_vector = to_tsvector('english', content)"
+        'CREATE INDEX ix_document_chunks_search ON document_chunks USING GIN(search_vector)'
     )
 
-    # 4. Create trigger function for auto-update on INSERT/UPDATE
-    op.execute("""
-        CREATE OR REPLACE FUNCTION update_chunk_search_vector()
-        RETURNS trigger AS $$
-        BEGIN
-            NEW.search_vector := to_tsvector('english', NEW.content);
-            RETURN NEW;
-        END;
-        $$ LANGUAGE plpgsql;
-    """)
-
-    op.execute("""
-        CREATE TRIGGER trg_chunk_search_vector
-        BEFORE INSERT OR UPDATE OF content ON document_chunks
-        FOR EACH ROW EXECUTE FUNCTION update_chunk_search_vector();
-    """)
-
 
 def downgrade() -> None:
     """Remove full-text search support from document_chunks."""
-    op.execute('DROP TRIGGER IF EXISTS trg_chunk_search_vector ON document_chunks')
-    op.execute('DROP FUNCTION IF EXISTS update_chunk_search_vector()')
     op.execute('DROP INDEX IF EXISTS ix_document_chunks_search')
     op.drop_column('document_chunks', 'search_vector')
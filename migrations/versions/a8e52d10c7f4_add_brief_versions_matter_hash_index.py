@@ -0,0 +1,32 @@
+"""add_brief_versions_matter_hash_index
+
+Revision ID: a8e52d10c7f4
+Revises: f03b6c2a9d18
+Create Date: 2026-08-30 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e52d10c7f4'
+down_revision: Union[str, Sequence[str], None] = 'f03b6c2a9d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index brief version dedupe lookups by (matter_id, source_material_hash)."""
+    op.create_index(
+        'ix_brief_versions_matter_hash',
+        'brief_versions',
+        ['matter_id', 'source_material_hash'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the brief version dedupe index."""
+    op.drop_index('ix_brief_versions_matter_hash', table_name='brief_versions')
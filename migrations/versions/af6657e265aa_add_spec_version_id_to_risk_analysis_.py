@@ -20,16 +20,18 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Add spec_version_id column to risk_analysis_versions
-    op.add_column('risk_analysis_versions', sa.Column('spec_version_id', sa.UUID(), nullable=True))
-    op.create_foreign_key(
-        'fk_risk_analysis_versions_spec_version_id',
-        'risk_analysis_versions', 'spec_versions',
-        ['spec_version_id'], ['id'],
+    # Add spec_version_id column with its FK in one ALTER TABLE: a single
+    # AccessExclusiveLock acquisition and catalog pass instead of two
+    op.execute(
+        "ALTER TABLE risk_analysis_versions "
+        "ADD COLUMN spec_version_id uuid "
+        "CONSTRAINT fk_risk_analysis_versions_spec_version_id REFERENCES spec_versions(id)"
     )
 
-    # Add RISK_RE_REVIEWED to matterstate enum
-    op.execute("ALTER TYPE matterstate ADD VALUE IF NOT EXISTS 'RISK_RE_REVIEWED' AFTER 'SPEC_GENERATED'")
+    # Add RISK_RE_REVIEWED to matterstate enum, outside the migration
+    # transaction for PG versions where ADD VALUE rejects transaction blocks
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE matterstate ADD VALUE IF NOT EXISTS 'RISK_RE_REVIEWED' AFTER 'SPEC_GENERATED'")
 
 
 def downgrade() -> None:
@@ -0,0 +1,32 @@
+"""add_brief_versions_matter_version_index
+
+Revision ID: b2c74e91f0a3
+Revises: a8e52d10c7f4
+Create Date: 2026-08-30 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c74e91f0a3'
+down_revision: Union[str, Sequence[str], None] = 'a8e52d10c7f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (matter_id, version_number) for index-only MAX scans."""
+    op.create_index(
+        'ix_brief_versions_matter_version',
+        'brief_versions',
+        ['matter_id', 'version_number'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the brief version numbering index."""
+    op.drop_index('ix_brief_versions_matter_version', table_name='brief_versions')
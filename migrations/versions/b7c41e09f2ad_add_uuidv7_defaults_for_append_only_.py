@@ -0,0 +1,58 @@
+"""add uuidv7 defaults for append-only tables
+
+Revision ID: b7c41e09f2ad
+Revises: 673c250dfd3e
+Create Date: 2026-02-23 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c41e09f2ad'
+down_revision: Union[str, Sequence[str], None] = '673c250dfd3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Default append-only ids to time-ordered UUIDv7.
+
+    Random v4 primary keys touch a random btree leaf per insert; v7 ids are
+    time-prefixed so the PK index grows to the right, matching the insert
+    pattern of the audit log and version tables. Defined in SQL to avoid an
+    extension dependency (pg_uuidv7).
+    """
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        placing substring(
+                            int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                            from 3
+                        )
+                        from 1 for 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex'
+        )::uuid;
+        $$ LANGUAGE sql VOLATILE;
+    """)
+    op.execute("ALTER TABLE audit_events ALTER COLUMN id SET DEFAULT uuidv7()")
+    op.execute("ALTER TABLE qa_report_versions ALTER COLUMN id SET DEFAULT uuidv7()")
+
+
+def downgrade() -> None:
+    """Drop the UUIDv7 defaults and helper function."""
+    op.execute("ALTER TABLE qa_report_versions ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER TABLE audit_events ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP FUNCTION IF EXISTS uuidv7()")
@@ -39,13 +39,15 @@ def upgrade() -> None:
     sa.PrimaryKeyConstraint('id')
     )
     op.create_index(op.f('ix_qa_report_versions_matter_id'), 'qa_report_versions', ['matter_id'], unique=False)
-
-    # Add active_qa_version_id to workstreams
-    op.add_column('workstreams', sa.Column('active_qa_version_id', sa.UUID(), nullable=True))
-    op.create_foreign_key(
-        'fk_workstreams_active_qa_version_id',
-        'workstreams', 'qa_report_versions',
-        ['active_qa_version_id'], ['id'],
+    # jsonb_path_ops GIN: same @> containment performance as jsonb_ops at ~20% the size
+    op.execute("CREATE INDEX ix_qa_report_versions_report_data_gin ON qa_report_versions USING GIN (report_data jsonb_path_ops)")
+
+    # Add active_qa_version_id with its FK in one ALTER TABLE: a single
+    # AccessExclusiveLock acquisition and catalog pass instead of two
+    op.execute(
+        "ALTER TABLE workstreams "
+        "ADD COLUMN active_qa_version_id uuid "
+        "CONSTRAINT fk_workstreams_active_qa_version_id REFERENCES qa_report_versions(id)"
     )
 
 
@@ -53,5 +55,6 @@ def downgrade() -> None:
     """Downgrade schema."""
     op.drop_constraint('fk_workstreams_active_qa_version_id', 'workstreams', type_='foreignkey')
     op.drop_column('workstreams', 'active_qa_version_id')
+    op.execute("DROP INDEX IF EXISTS ix_qa_report_versions_report_data_gin")
     op.drop_index(op.f('ix_qa_report_versions_matter_id'), table_name='qa_report_versions')
     op.drop_table('qa_report_versions')
@@ -0,0 +1,55 @@
+"""add_jsonb_gin_and_audit_brin_indexes
+
+Revision ID: c91d4ab07e25
+Revises: b7c41e09f2ad
+Create Date: 2026-08-30 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c91d4ab07e25'
+down_revision: Union[str, Sequence[str], None] = 'b7c41e09f2ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the JSONB artifact payloads and the audit-log time axis."""
+    # 1. GIN with jsonb_path_ops on the artifact payload columns. Containment
+    #    (@>) queries against these currently full-scan; jsonb_path_ops builds
+    #    a smaller, faster index than the default opclass at the cost of only
+    #    supporting containment — which is the only operator used on them.
+    op.execute(
+        "CREATE INDEX ix_brief_versions_structure_gin "
+        "ON brief_versions USING gin (structure_data jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_claim_graph_versions_graph_gin "
+        "ON claim_graph_versions USING gin (graph_data jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_spec_versions_content_gin "
+        "ON spec_versions USING gin (content_data jsonb_path_ops)"
+    )
+
+    # 2. BRIN on audit_events.created_at. The table is append-only with
+    #    uuidv7 PKs, so created_at correlates near-perfectly with heap order;
+    #    BRIN gives range scans (the audit timeline endpoint orders by
+    #    created_at) at a fraction of a btree's size and write cost.
+    op.execute(
+        "CREATE INDEX ix_audit_events_created_at_brin "
+        "ON audit_events USING brin (created_at)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the JSONB GIN indexes and the audit BRIN index."""
+    op.execute('DROP INDEX IF EXISTS ix_audit_events_created_at_brin')
+    op.execute('DROP INDEX IF EXISTS ix_spec_versions_content_gin')
+    op.execute('DROP INDEX IF EXISTS ix_claim_graph_versions_graph_gin')
+    op.execute('DROP INDEX IF EXISTS ix_brief_versions_structure_gin')
@@ -0,0 +1,34 @@
+"""add_tenant_scoped_auth_indexes
+
+Revision ID: d6f18ba42c09
+Revises: b2c74e91f0a3
+Create Date: 2026-08-30 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f18ba42c09'
+down_revision: Union[str, Sequence[str], None] = 'b2c74e91f0a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index tenant_id FKs and the tenant-scoped user email lookup."""
+    op.create_index('ix_users_tenant_id', 'users', ['tenant_id'])
+    op.create_index('ix_groups_tenant_id', 'groups', ['tenant_id'])
+    op.create_index('ix_invitations_tenant_id', 'invitations', ['tenant_id'])
+    op.create_index('ix_users_tenant_email', 'users', ['tenant_id', 'email'])
+
+
+def downgrade() -> None:
+    """Drop the tenant-scoped auth indexes."""
+    op.drop_index('ix_users_tenant_email', table_name='users')
+    op.drop_index('ix_invitations_tenant_id', table_name='invitations')
+    op.drop_index('ix_groups_tenant_id', table_name='groups')
+    op.drop_index('ix_users_tenant_id', table_name='users')
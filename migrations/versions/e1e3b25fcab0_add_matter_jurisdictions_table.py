@@ -20,10 +20,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Add new enum values to the existing jurisdictionenum type
-    op.execute("ALTER TYPE jurisdictionenum ADD VALUE IF NOT EXISTS 'JPO'")
-    op.execute("ALTER TYPE jurisdictionenum ADD VALUE IF NOT EXISTS 'KIPO'")
-    op.execute("ALTER TYPE jurisdictionenum ADD VALUE IF NOT EXISTS 'CNIPA'")
+    # Add new enum values to the existing jurisdictionenum type. Plain
+    # statements inside an autocommit block — a DO block would wrap them in
+    # an implicit transaction, which ALTER TYPE ... ADD VALUE rejects on
+    # older PG.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE jurisdictionenum ADD VALUE IF NOT EXISTS 'JPO'")
+        op.execute("ALTER TYPE jurisdictionenum ADD VALUE IF NOT EXISTS 'KIPO'")
+        op.execute("ALTER TYPE jurisdictionenum ADD VALUE IF NOT EXISTS 'CNIPA'")
     
     # Create the association table, reusing the existing enum type
     op.create_table('matter_jurisdictions',
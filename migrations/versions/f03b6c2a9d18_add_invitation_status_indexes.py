@@ -0,0 +1,32 @@
+"""add_invitation_status_indexes
+
+Revision ID: f03b6c2a9d18
+Revises: c91d4ab07e25
+Create Date: 2026-08-30 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f03b6c2a9d18'
+down_revision: Union[str, Sequence[str], None] = 'c91d4ab07e25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index invitation status lookups and expiry range scans."""
+    op.create_index('ix_invitations_status', 'invitations', ['status'])
+    op.create_index('ix_invitations_email_status', 'invitations', ['email', 'status'])
+    op.create_index('ix_invitations_expires_status', 'invitations', ['expires_at', 'status'])
+
+
+def downgrade() -> None:
+    """Drop the invitation status indexes."""
+    op.drop_index('ix_invitations_expires_status', table_name='invitations')
+    op.drop_index('ix_invitations_email_status', table_name='invitations')
+    op.drop_index('ix_invitations_status', table_name='invitations')
@@ -3,14 +3,35 @@ Re-embed all document chunks using the current embedding provider.
 
 Usage:
     cd backend && uv run python -m scripts.reembed_chunks
+
+For large backlogs, launch N worker processes, each owning a disjoint
+hash-shard of the chunk ids:
+
+    uv run python -m scripts.reembed_chunks --shard 0 --of 4
+    uv run python -m scripts.reembed_chunks --shard 1 --of 4
+    ...
+
+The bottleneck is embedding-provider RTT, so throughput scales roughly
+linearly with workers until the provider rate-limits.
 """
 
+import argparse
 import asyncio
+import hashlib
 import logging
-
-from sqlalchemy import select, func
+import os
+
+import httpx
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event, select, func, text
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import load_only, sessionmaker
 
 # Import the app to ensure all models are registered with SQLAlchemy
 import src.main  # noqa: F401
@@ -22,50 +43,177 @@ from src.llm.factory import get_embeddings
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 50
+BATCH_SIZE = int(os.getenv("REEMBED_BATCH_SIZE", "256"))
+
+# The OpenAI/Azure embedding clients raise their own exception hierarchy
+# (RateLimitError, APIStatusError, APIConnectionError — all under APIError)
+# rather than letting the underlying httpx errors escape, so retrying on
+# httpx types alone would never fire for them. openai ships with the
+# langchain-openai providers; guard the import for deployments without it.
+try:
+    from openai import APIError as _OpenAIAPIError
+
+    _RETRYABLE_EMBED_ERRORS = (
+        httpx.HTTPError,
+        ConnectionError,
+        TimeoutError,
+        _OpenAIAPIError,
+    )
+except ImportError:
+    _RETRYABLE_EMBED_ERRORS = (httpx.HTTPError, ConnectionError, TimeoutError)
+
+# Hash-based shard predicate over the UUID primary key; mod(abs(...)) keeps
+# the remainder non-negative.
+_SHARD_CLAUSE = text("mod(abs(hashtext(document_chunks.id::text)), :shard_count) = :shard_index")
+
+
+def _shard_filter(shard_index: int, shard_count: int):
+    return _SHARD_CLAUSE.bindparams(shard_count=shard_count, shard_index=shard_index)
+
+
+async def fetch_batch(
+    db: AsyncSession, last_id, shard_index: int = 0, shard_count: int = 1
+) -> list[DocumentChunk]:
+    """Fetch the next keyset-paginated batch of chunks with NULL embeddings.
+
+    Streamed through a server-side cursor (yield_per) so rows arrive in
+    small buffers instead of one driver-side materialization of the whole
+    batch's content.
+    """
+    query = (
+        select(DocumentChunk)
+        # Only id and content are needed; skip hydrating the old embedding,
+        # search_vector and metadata columns on every row.
+        .options(load_only(DocumentChunk.id, DocumentChunk.content))
+        .where(DocumentChunk.embedding.is_(None))
+        .order_by(DocumentChunk.id)
+        .limit(BATCH_SIZE)
+        .execution_options(yield_per=64)
+    )
+    if shard_count > 1:
+        query = query.where(_shard_filter(shard_index, shard_count))
+    if last_id is not None:
+        query = query.where(DocumentChunk.id > last_id)
+    stream = await db.stream_scalars(query)
+    return [chunk async for chunk in stream]
+
+
+@retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception_type(_RETRYABLE_EMBED_ERRORS),
+    reraise=True,
+)
+async def _embed_remote(embeddings, texts: list[str]) -> list:
+    """Call the embedding provider with exponential-backoff retry.
+
+    A transient 429/5xx no longer kills the whole run mid-backfill; the
+    keyset cursor means a restart after exhausted retries resumes where the
+    last commit left off.
+    """
+    return await embeddings.aembed_documents(texts)
+
+
+# Cross-batch content-hash → vector cache. Chunk content repeats in practice
+# (headers, boilerplate, shared claim prefixes), so identical strings are
+# embedded once per run instead of once per occurrence.
+_vector_cache: dict[bytes, list] = {}
+_VECTOR_CACHE_MAX = 50_000
+
+
+async def embed_batch(embeddings, texts: list[str]) -> list:
+    """Embed a batch of texts, deduplicating identical content first."""
+    keys = [hashlib.blake2b(t.encode(), digest_size=16).digest() for t in texts]
+
+    pending: dict[bytes, str] = {}
+    for key, content in zip(keys, texts):
+        if key not in _vector_cache:
+            pending[key] = content
+
+    if pending:
+        if len(_vector_cache) + len(pending) > _VECTOR_CACHE_MAX:
+            _vector_cache.clear()
+        vectors = await _embed_remote(embeddings, list(pending.values()))
+        _vector_cache.update(zip(pending.keys(), vectors))
+
+    return [_vector_cache[key] for key in keys]
+
+
+async def write_batch(db: AsyncSession, ids, vectors) -> None:
+    """Write a batch of embeddings back via binary COPY plus one merge UPDATE.
+
+    copy_records_to_table stages the batch through PG's binary COPY protocol
+    (packed float32 via the registered pgvector codec, no per-row parameter
+    binding or text parsing), then a single UPDATE ... FROM merges it into
+    document_chunks. The temp table lives for the session's open transaction
+    and is dropped at commit.
+    """
+    raw = await (await db.connection()).get_raw_connection()
+    ac = raw.driver_connection
+    await ac.execute(
+        "CREATE TEMP TABLE _reembed (id uuid PRIMARY KEY, embedding vector(1536)) "
+        "ON COMMIT DROP"
+    )
+    await ac.copy_records_to_table("_reembed", records=list(zip(ids, vectors)))
+    await ac.execute(
+        "UPDATE document_chunks d SET embedding = t.embedding::halfvec(1536) "
+        "FROM _reembed t WHERE d.id = t.id"
+    )
+    await db.commit()
+
+
+async def reembed_all(shard_index: int = 0, shard_count: int = 1):
+    engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
 
+    # Install pgvector's binary codec on every asyncpg connection so vectors
+    # travel as packed floats instead of being rendered to and parsed from
+    # their text form element by element.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_vector_codec(dbapi_conn, _record):
+        dbapi_conn.run_async(register_vector)
 
-async def reembed_all():
-    engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
     embeddings = get_embeddings()
 
     async with async_session() as db:
-        # Count chunks needing re-embedding (NULL embedding)
-        count_result = await db.execute(
-            select(func.count(DocumentChunk.id)).where(DocumentChunk.embedding.is_(None))
+        # Count chunks needing re-embedding (NULL embedding) in this shard
+        count_query = select(func.count(DocumentChunk.id)).where(
+            DocumentChunk.embedding.is_(None)
         )
+        if shard_count > 1:
+            count_query = count_query.where(_shard_filter(shard_index, shard_count))
+        count_result = await db.execute(count_query)
         total = count_result.scalar()
-        logger.info(f"Found {total} chunks with NULL embeddings to re-embed")
+        logger.info(
+            f"Found {total} chunks with NULL embeddings to re-embed "
+            f"(shard {shard_index}/{shard_count})"
+        )
 
         if total == 0:
             logger.info("Nothing to do")
             return
 
-        # Process in batches
-        offset = 0
+        # Process in batches using keyset pagination: tracking the last seen id
+        # keeps the index scan bounded to the remaining tail instead of
+        # re-filtering and re-sorting already-committed rows every iteration.
+        # The embedding RPC for the current batch is overlapped with fetching
+        # the next one, so wall time per batch approaches
+        # max(embed_latency, db_latency) rather than their sum.
         processed = 0
-        while True:
-            result = await db.execute(
-                select(DocumentChunk)
-                .where(DocumentChunk.embedding.is_(None))
-                .order_by(DocumentChunk.id)
-                .limit(BATCH_SIZE)
-            )
-            chunks = list(result.scalars().all())
-            if not chunks:
-                break
-
+        chunks = await fetch_batch(db, None, shard_index, shard_count)
+        while chunks:
+            last_id = chunks[-1].id
             texts = [c.content for c in chunks]
-            vectors = await embeddings.aembed_documents(texts)
-
-            for chunk, vector in zip(chunks, vectors):
-                chunk.embedding = vector
+            vectors, next_chunks = await asyncio.gather(
+                embed_batch(embeddings, texts),  # dedups identical content
+                fetch_batch(db, last_id, shard_index, shard_count),
+            )
 
-            await db.commit()
+            await write_batch(db, [c.id for c in chunks], vectors)
             processed += len(chunks)
             logger.info(f"Re-embedded {processed}/{total} chunks")
+            chunks = next_chunks
 
         logger.info(f"Done. Re-embedded {processed} chunks total.")
 
@@ -73,4 +221,10 @@ async def reembed_all():
 
 
 if __name__ == "__main__":
-    asyncio.run(reembed_all())
+    parser = argparse.ArgumentParser(description="Re-embed document chunks")
+    parser.add_argument("--shard", type=int, default=0, help="shard index of this worker")
+    parser.add_argument("--of", type=int, default=1, help="total number of shards")
+    args = parser.parse_args()
+    if not 0 <= args.shard < args.of:
+        parser.error("--shard must be in [0, --of)")
+    asyncio.run(reembed_all(args.shard, args.of))
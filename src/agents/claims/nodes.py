@@ -5,13 +5,17 @@ a partial state dict.  LLM-backed nodes use ``with_structured_output`` for
 reliable JSON parsing.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Tuple
 
-from langchain_core.prompts import ChatPromptTemplate
+import orjson
 
-from src.llm.factory import get_primary_llm
+from pydantic import ValidationError
+
+from src.llm.factory import get_primary_llm, get_llm_semaphore
 from src.drafting.schemas import ClaimNode, ClaimGraph
 from src.agents.claims.schemas import (
     CanonicalClaimModel,
@@ -34,6 +38,203 @@ from src.agents.claims.prompts import (
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Prompt formatting and chain cache
+#
+# Templates are static and share str.format's {var}/{{}} syntax, so instead
+# of routing every call through ChatPromptTemplate's template engine the
+# messages are built directly: system prompts are unescaped once at import
+# and user prompts rendered with a single C-level format_map call.
+# Structured-output models are cached per stage and rebuilt only when the
+# factory hands back a different LLM instance (i.e. after a settings change
+# clears its cache) — with_structured_output recompiles the Pydantic schema
+# on every call otherwise.
+# ---------------------------------------------------------------------------
+
+def _unescape(template: str) -> str:
+    """Resolve ``{{``/``}}`` escapes in a template with no placeholders."""
+    return template.replace("{{", "{").replace("}}", "}")
+
+
+_STAGE_MESSAGES: Dict[str, Tuple[str, str]] = {
+    "ccm": (_unescape(CCM_SYSTEM_PROMPT), CCM_USER_PROMPT),
+    "system": (_unescape(SYSTEM_CLAIM_SYSTEM_PROMPT), SYSTEM_CLAIM_USER_PROMPT),
+    "method": (_unescape(METHOD_MIRROR_SYSTEM_PROMPT), METHOD_MIRROR_USER_PROMPT),
+    "medium": (_unescape(MEDIUM_MIRROR_SYSTEM_PROMPT), MEDIUM_MIRROR_USER_PROMPT),
+    "scope": (_unescape(SCOPE_VALIDATOR_SYSTEM_PROMPT), SCOPE_VALIDATOR_USER_PROMPT),
+}
+
+
+def _format_messages(stage: str, payload: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    system_text, user_template = _STAGE_MESSAGES[stage]
+    user_text = user_template.format_map(payload)
+    if type(_chain_cache_llm).__name__ == "ChatAnthropic":
+        # Mark the static system prompt as a cache breakpoint so repeated
+        # stage calls hit the provider's prompt cache for the shared prefix.
+        return [
+            (
+                "system",
+                [{
+                    "type": "text",
+                    "text": system_text,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+            ),
+            ("user", user_text),
+        ]
+    return [("system", system_text), ("user", user_text)]
+
+_STAGE_SCHEMAS = {
+    "ccm": CanonicalClaimModel,
+    "system": PartialClaimSet,
+    "method": PartialClaimSet,
+    "medium": PartialClaimSet,
+    "scope": ScopeValidationResult,
+}
+
+_chain_cache: Dict[str, Any] = {}
+_chain_cache_llm = None
+
+
+def _get_chain(stage: str):
+    """Return the cached structured-output model for a stage."""
+    global _chain_cache_llm
+    llm = get_primary_llm()
+    if llm is not _chain_cache_llm:
+        _chain_cache.clear()
+        _chain_cache_llm = llm
+    chain = _chain_cache.get(stage)
+    if chain is None:
+        chain = llm.with_structured_output(_STAGE_SCHEMAS[stage]).with_retry(
+            wait_exponential_jitter=True, stop_after_attempt=3
+        )
+        _chain_cache[stage] = chain
+    return chain
+
+
+# ---------------------------------------------------------------------------
+# Stage-1 micro-batching
+#
+# Concurrent briefs each fire an independent CCM extraction; collecting the
+# calls that arrive within a short window and issuing one abatch() lets the
+# provider batch inference across them instead of serving N serial requests.
+# ---------------------------------------------------------------------------
+
+class _MicroBatcher:
+    """Coalesce concurrent chain invocations into abatch() calls."""
+
+    def __init__(self, stage: str, window_ms: int = 25, max_batch: int = 16):
+        self._stage = stage
+        self._window = window_ms / 1000.0
+        self._max_batch = max_batch
+        self._pending: List[tuple] = []
+        self._flush_task = None
+
+    async def invoke(self, payload: Dict[str, Any]):
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((payload, fut))
+        if len(self._pending) >= self._max_batch:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            asyncio.ensure_future(self._flush())
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await fut
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self._window)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            async with get_llm_semaphore():
+                results = await _get_chain(self._stage).abatch(
+                    [_format_messages(self._stage, p) for p, _ in pending]
+                )
+        except Exception as e:  # propagate to every caller in the batch
+            for _, fut in pending:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), result in zip(pending, results):
+            if not fut.done():
+                fut.set_result(result)
+
+
+_CCM_BATCHER = _MicroBatcher("ccm")
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+#
+# Resubmitted briefs (and identical canonical models) re-run the exact same
+# prompts; an exact-match cache keyed on the stage plus a digest of the
+# payload turns those repeat multi-second LLM calls into sub-millisecond
+# lookups. Entries hold the structured result as JSON so hits revalidate
+# cheaply via model_validate_json.
+# ---------------------------------------------------------------------------
+
+_RESPONSE_CACHE: Dict[str, str] = {}
+_RESPONSE_CACHE_MAX = 1024
+
+
+def clear_response_cache() -> None:
+    """Drop cached stage responses (called when LLM settings change)."""
+    _RESPONSE_CACHE.clear()
+
+
+async def _cached_invoke(stage: str, payload: Dict[str, Any], invoker=None):
+    """Invoke a stage chain with an exact-match response cache.
+
+    ``invoker`` overrides the default ``ainvoke`` on cache misses (used by
+    the stage-1 micro-batcher).
+    """
+    key = (
+        hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        + ":"
+        + stage
+    )
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return _STAGE_SCHEMAS[stage].model_validate_json(cached)
+
+    if invoker is not None:
+        # The micro-batcher acquires the semaphore around its own abatch call
+        result = await invoker(payload)
+    else:
+        async with get_llm_semaphore():
+            result = await _get_chain(stage).ainvoke(_format_messages(stage, payload))
+    if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+        _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+    _RESPONSE_CACHE[key] = result.model_dump_json()
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Failure logging
+#
+# Expected failure modes (timeouts, dropped connections, malformed structured
+# output) are logged at WARNING without traceback capture; only genuinely
+# unexpected exceptions pay for ERROR-level formatting.
+# ---------------------------------------------------------------------------
+
+_RETRYABLE_ERRORS = (asyncio.TimeoutError, ConnectionError)
+
+
+def _log_stage_failure(desc: str, exc: BaseException) -> None:
+    if isinstance(exc, _RETRYABLE_ERRORS):
+        logger.warning("%s (retryable): %s", desc, exc)
+    elif isinstance(exc, ValidationError):
+        logger.warning("%s (invalid structured output): %s", desc, exc)
+    elif logger.isEnabledFor(logging.ERROR):
+        logger.error("%s: %s", desc, exc)
+
+
 # ---------------------------------------------------------------------------
 # Routing helper
 # ---------------------------------------------------------------------------
@@ -50,27 +251,26 @@ def check_errors(state: Dict[str, Any]) -> str:
 # ---------------------------------------------------------------------------
 
 async def canonical_claim_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(CanonicalClaimModel)
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", CCM_SYSTEM_PROMPT),
-        ("user", CCM_USER_PROMPT),
-    ])
-
-    chain = prompt | structured_llm
-
     try:
-        result: CanonicalClaimModel = await chain.ainvoke({
-            "brief_text": state["brief_text"],
-            "document_context": state.get("document_context", ""),
-        })
+        result: CanonicalClaimModel = await _cached_invoke(
+            "ccm",
+            {
+                "brief_text": state["brief_text"],
+                "document_context": state.get("document_context", ""),
+            },
+            invoker=_CCM_BATCHER.invoke,
+        )
+        ccm_dict = result.model_dump()
         return {
-            "canonical_model": result.model_dump(),
+            "canonical_model": ccm_dict,
+            # Serialized once here; stages 2/3a/3b/5 all interpolate the same
+            # JSON into their prompts, so they reuse this instead of each
+            # re-serializing the dict.
+            "canonical_model_json": orjson.dumps(ccm_dict).decode(),
             "errors": [],
         }
     except Exception as e:
-        logger.error("CCM extraction failed: %s", e)
+        _log_stage_failure("CCM extraction failed", e)
         return {"errors": [f"CCM extraction failed: {e}"]}
 
 
@@ -79,182 +279,211 @@ async def canonical_claim_node(state: Dict[str, Any]) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 async def system_claim_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(PartialClaimSet)
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SYSTEM_CLAIM_SYSTEM_PROMPT),
-        ("user", SYSTEM_CLAIM_USER_PROMPT),
-    ])
-
-    chain = prompt | structured_llm
-
     try:
-        result: PartialClaimSet = await chain.ainvoke({
-            "canonical_model": json.dumps(state["canonical_model"], indent=2),
+        result: PartialClaimSet = await _cached_invoke("system", {
+            "canonical_model": state["canonical_model_json"],
             "brief_text": state["brief_text"],
         })
-        nodes_dicts = [n.model_dump() for n in result.nodes]
         return {
-            "system_claim_nodes": nodes_dicts,
+            "system_claim_nodes": list(result.nodes),
             "errors": [],
         }
     except Exception as e:
-        logger.error("System claim generation failed: %s", e)
+        _log_stage_failure("System claim generation failed", e)
         return {"errors": [f"System claim generation failed: {e}"]}
 
 
 # ---------------------------------------------------------------------------
-# Stage 3a — Mirror method claims
+# Stage 3 — Mirror method + CRM claims concurrently
 # ---------------------------------------------------------------------------
 
-async def method_claim_mirror_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(PartialClaimSet)
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", METHOD_MIRROR_SYSTEM_PROMPT),
-        ("user", METHOD_MIRROR_USER_PROMPT),
-    ])
-
-    chain = prompt | structured_llm
-
-    try:
-        result: PartialClaimSet = await chain.ainvoke({
-            "canonical_model": json.dumps(state["canonical_model"], indent=2),
-            "system_claims": json.dumps(state["system_claim_nodes"], indent=2),
-        })
-        nodes_dicts = [n.model_dump() for n in result.nodes]
-        return {
-            "method_claim_nodes": nodes_dicts,
-            "errors": [],
-        }
-    except Exception as e:
-        logger.error("Method mirror failed: %s", e)
-        return {"errors": [f"Method mirror failed: {e}"]}
-
+async def mirror_claims_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Run both mirror stages concurrently.
 
-# ---------------------------------------------------------------------------
-# Stage 3b — Mirror CRM claims
-# ---------------------------------------------------------------------------
-
-async def medium_claim_mirror_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    # Fast-exit when the invention is not software-based
+    The method and CRM mirrors share identical inputs and have no mutual
+    dependency, so the shared payload is serialized once and both chains are
+    awaited together — stage-3 wall time is the slower of the two calls
+    instead of their sum. The CRM branch short-circuits to an empty set for
+    non-software inventions while keeping the gather shape stable, and a
+    failure in one branch surfaces as an error without dropping the other.
+    """
     ccm = state.get("canonical_model", {})
-    if not ccm.get("is_software_based", False):
-        return {
-            "medium_claim_nodes": [],
-            "errors": [],
-        }
-
-    llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(PartialClaimSet)
+    # Compact serialization: the model doesn't need indentation, and the
+    # whitespace would only inflate prompt token count. The CCM JSON itself
+    # was serialized once after stage 1 and is reused from state.
+    inputs = {
+        "canonical_model": state["canonical_model_json"],
+        "system_claims": orjson.dumps(
+            [n.model_dump() for n in state["system_claim_nodes"]]
+        ).decode(),
+    }
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", MEDIUM_MIRROR_SYSTEM_PROMPT),
-        ("user", MEDIUM_MIRROR_USER_PROMPT),
-    ])
+    async def _mirror(stage: str) -> List[ClaimNode]:
+        if stage == "medium" and not ccm.get("is_software_based", False):
+            await asyncio.sleep(0)
+            return []
+        result: PartialClaimSet = await _cached_invoke(stage, inputs)
+        return list(result.nodes)
 
-    chain = prompt | structured_llm
+    method_res, medium_res = await asyncio.gather(
+        _mirror("method"), _mirror("medium"), return_exceptions=True
+    )
 
-    try:
-        result: PartialClaimSet = await chain.ainvoke({
-            "canonical_model": json.dumps(state["canonical_model"], indent=2),
-            "system_claims": json.dumps(state["system_claim_nodes"], indent=2),
-        })
-        nodes_dicts = [n.model_dump() for n in result.nodes]
-        return {
-            "medium_claim_nodes": nodes_dicts,
-            "errors": [],
-        }
-    except Exception as e:
-        logger.error("CRM mirror failed: %s", e)
-        return {"errors": [f"CRM mirror failed: {e}"]}
+    out: Dict[str, Any] = {
+        "method_claim_nodes": [],
+        "medium_claim_nodes": [],
+        "errors": [],
+    }
+    if isinstance(method_res, BaseException):
+        _log_stage_failure("Method mirror failed", method_res)
+        out["errors"].append(f"Method mirror failed: {method_res}")
+    else:
+        out["method_claim_nodes"] = method_res
+    if isinstance(medium_res, BaseException):
+        _log_stage_failure("CRM mirror failed", medium_res)
+        out["errors"].append(f"CRM mirror failed: {medium_res}")
+    else:
+        out["medium_claim_nodes"] = medium_res
+    return out
 
 
 # ---------------------------------------------------------------------------
-# Stage 4 — Assemble and renumber all claims (pure logic, no LLM)
+# Stages 4 + 5 — Assemble/renumber all claims while scope validation runs
 # ---------------------------------------------------------------------------
 
-async def assemble_claims_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    system_nodes: List[Dict[str, Any]] = state.get("system_claim_nodes") or []
-    method_nodes: List[Dict[str, Any]] = state.get("method_claim_nodes") or []
-    medium_nodes: List[Dict[str, Any]] = state.get("medium_claim_nodes") or []
+# Claim sets above this size get renumbered on a worker thread so the pure
+# CPU work doesn't stall the event loop under concurrent requests.
+_ASSEMBLE_INLINE_MAX = 50
 
-    all_nodes = system_nodes + method_nodes + medium_nodes
-
-    if not all_nodes:
-        return {"errors": ["No claims were generated across any category"]}
 
+def _assemble_sync(
+    all_nodes: List[ClaimNode], canonical_model: Any
+) -> Dict[str, Any]:
     # Build old-id → new-id mapping (sequential 1-based)
-    id_map: Dict[str, str] = {}
-    for idx, node in enumerate(all_nodes, start=1):
-        id_map[node["id"]] = str(idx)
+    id_map: Dict[str, str] = {n.id: str(i) for i, n in enumerate(all_nodes, start=1)}
 
-    # Renumber
-    renumbered: List[Dict[str, Any]] = []
+    # Renumber and collect independents in a single pass. The upstream nodes
+    # thread validated ClaimNode objects through state, so renumbering is a
+    # validation-free model_copy rather than a dict round-trip plus rebuild.
+    renumbered: List[ClaimNode] = []
+    independents: List[ClaimNode] = []
     for node in all_nodes:
-        new_node = dict(node)
-        new_node["id"] = id_map[node["id"]]
-        new_node["dependencies"] = [
-            id_map[dep] for dep in node.get("dependencies", []) if dep in id_map
-        ]
-        if node.get("mirror_source") and node["mirror_source"] in id_map:
-            new_node["mirror_source"] = id_map[node["mirror_source"]]
+        deps = node.dependencies
+        mirror_source = node.mirror_source
+        if deps:
+            # Deps normally all resolve (they reference sibling claims from
+            # the same generation), so skip the per-element membership test
+            # and only fall back to filtering if the invariant is broken.
+            try:
+                new_deps = [id_map[d] for d in deps]
+            except KeyError:
+                new_deps = [id_map[d] for d in deps if d in id_map]
+        else:
+            new_deps = []
+        update: Dict[str, Any] = {
+            "id": id_map[node.id],
+            "dependencies": new_deps,
+        }
+        if mirror_source and mirror_source in id_map:
+            update["mirror_source"] = id_map[mirror_source]
+        new_node = node.model_copy(update=update)
         renumbered.append(new_node)
+        if node.type == "independent":
+            independents.append(new_node)
 
-    # Collect independent nodes for scope validation
-    independents = [n for n in renumbered if n.get("type") == "independent"]
-
-    # Build ClaimGraph
-    claim_nodes = [ClaimNode(**n) for n in renumbered]
     claim_graph = ClaimGraph(
-        nodes=claim_nodes,
+        nodes=renumbered,
         risk_score=None,
-        canonical_model=state.get("canonical_model"),
+        canonical_model=canonical_model,
     )
 
     return {
         "claim_graph": claim_graph,
         "all_independent_nodes": independents,
+        "id_map": id_map,
         "errors": [],
     }
 
 
-# ---------------------------------------------------------------------------
-# Stage 5 — Scope consistency validation
-# ---------------------------------------------------------------------------
+async def _validate_scope(
+    canonical_model_json: str, independents: List[ClaimNode]
+) -> Dict[str, Any]:
+    """Run the scope-consistency check and return the validation dict."""
+    result: ScopeValidationResult = await _cached_invoke("scope", {
+        "canonical_model": canonical_model_json,
+        "independent_claims": orjson.dumps(
+            [n.model_dump() for n in independents]
+        ).decode(),
+    })
+    return result.model_dump()
+
+
+def _renumber_validation_refs(
+    validation: Dict[str, Any], id_map: Dict[str, str]
+) -> Dict[str, Any]:
+    """Rewrite pre-renumber claim ids cited in scope-validation text.
+
+    The validator sees the pre-renumber independents, so its free-text
+    fields can cite internal generation ids (e.g. "sys-1") that don't exist
+    in the final graph. Purely numeric internal ids are left alone — a bare
+    number in prose is indistinguishable from an ordinary count.
+    """
+    old_ids = sorted(
+        (old for old, new in id_map.items() if old != new and not old.isdigit()),
+        key=len,
+        reverse=True,
+    )
+    if not old_ids:
+        return validation
+    pattern = re.compile(r"\b(" + "|".join(re.escape(old) for old in old_ids) + r")\b")
+    for field in ("missing_elements", "extra_limitations", "notes"):
+        values = validation.get(field)
+        if values:
+            validation[field] = [
+                pattern.sub(lambda m: id_map[m.group(1)], v) for v in values
+            ]
+    return validation
 
-async def scope_consistency_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(ScopeValidationResult)
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SCOPE_VALIDATOR_SYSTEM_PROMPT),
-        ("user", SCOPE_VALIDATOR_USER_PROMPT),
-    ])
+async def assemble_claims_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    system_nodes: List[ClaimNode] = state.get("system_claim_nodes") or []
+    method_nodes: List[ClaimNode] = state.get("method_claim_nodes") or []
+    medium_nodes: List[ClaimNode] = state.get("medium_claim_nodes") or []
 
-    chain = prompt | structured_llm
+    all_nodes = system_nodes + method_nodes + medium_nodes
 
-    try:
-        result: ScopeValidationResult = await chain.ainvoke({
-            "canonical_model": json.dumps(state["canonical_model"], indent=2),
-            "independent_claims": json.dumps(
-                state.get("all_independent_nodes", []), indent=2
-            ),
-        })
+    if not all_nodes:
+        return {"errors": ["No claims were generated across any category"]}
 
-        validation_dict = result.model_dump()
+    # The scope check judges equivalence from the CCM and the independent-
+    # claim text, so the LLM round-trip is started on the pre-renumber
+    # independents and overlaps with the CPU assembly work instead of
+    # following it. Its output can still cite the internal claim ids it was
+    # shown, so those references are mapped to the final numbering below.
+    scope_task = asyncio.create_task(
+        _validate_scope(
+            state["canonical_model_json"],
+            [n for n in all_nodes if n.type == "independent"],
+        )
+    )
 
-        # Update the claim graph with validation results
-        claim_graph: ClaimGraph = state["claim_graph"]
-        claim_graph.scope_validation = validation_dict
+    if len(all_nodes) > _ASSEMBLE_INLINE_MAX:
+        assembled = await asyncio.get_running_loop().run_in_executor(
+            None, _assemble_sync, all_nodes, state.get("canonical_model")
+        )
+    else:
+        assembled = _assemble_sync(all_nodes, state.get("canonical_model"))
 
-        return {
-            "claim_graph": claim_graph,
-            "scope_validation": validation_dict,
-            "errors": [],
-        }
+    id_map = assembled.pop("id_map")
+
+    try:
+        validation_dict = await scope_task
     except Exception as e:
-        logger.error("Scope validation failed: %s", e)
-        return {"errors": [f"Scope validation failed: {e}"]}
+        _log_stage_failure("Scope validation failed", e)
+        assembled["errors"] = [f"Scope validation failed: {e}"]
+        return assembled
+
+    validation_dict = _renumber_validation_refs(validation_dict, id_map)
+    assembled["claim_graph"].scope_validation = validation_dict
+    assembled["scope_validation"] = validation_dict
+    return assembled
@@ -1,8 +1,12 @@
 """Specialized prompts for the claim mirroring pipeline.
 
 Each stage has its own system + user prompt pair. All use ``{{`` double-brace
-escaping so LangChain's ChatPromptTemplate treats them as literal braces in
-the JSON examples rather than template variables.
+escaping so str.format treats them as literal braces in the JSON examples
+rather than template variables.
+
+Prompts are laid out for provider prompt caching: system prompts are fully
+static, and user prompts put their static task header first with the dynamic
+fields at the very end, maximizing the common prefix across calls.
 """
 
 # ---------------------------------------------------------------------------
@@ -52,14 +56,14 @@ Rules:
 5. Set is_software_based to true if the invention is primarily software and eligible for computer-readable medium claims.
 6. Do not include preamble or explanatory text outside the JSON."""
 
-CCM_USER_PROMPT = """Here is the invention brief:
+CCM_USER_PROMPT = """Extract the Canonical Claim Model as JSON from the \
+invention brief and retrieved technical context below.
 
+## Invention Brief
 {brief_text}
 
 ## Retrieved Technical Context
-{document_context}
-
-Extract the Canonical Claim Model as JSON."""
+{document_context}"""
 
 
 # ---------------------------------------------------------------------------
@@ -98,13 +102,14 @@ Rules:
 6. Use ids prefixed with "sys-" (e.g., "sys-1", "sys-2").
 7. Do not include preamble or explanatory text outside the JSON."""
 
-SYSTEM_CLAIM_USER_PROMPT = """Canonical Claim Model:
+SYSTEM_CLAIM_USER_PROMPT = """Draft the system claims as JSON from the \
+Canonical Claim Model and original brief below.
+
+Canonical Claim Model:
 {canonical_model}
 
 Original brief for context:
-{brief_text}
-
-Draft the system claims as JSON."""
+{brief_text}"""
 
 
 # ---------------------------------------------------------------------------
@@ -153,13 +158,14 @@ Rules:
 6. Transform component language to method-step language per the rules above.
 7. Do not include preamble or explanatory text outside the JSON."""
 
-METHOD_MIRROR_USER_PROMPT = """Canonical Claim Model:
+METHOD_MIRROR_USER_PROMPT = """Generate mirrored method claims as JSON from \
+the Canonical Claim Model and system claims below.
+
+Canonical Claim Model:
 {canonical_model}
 
 System claims to mirror:
-{system_claims}
-
-Generate mirrored method claims as JSON."""
+{system_claims}"""
 
 
 # ---------------------------------------------------------------------------
@@ -210,13 +216,14 @@ Rules:
 7. Transform component language to instruction language per the rules above.
 8. Do not include preamble or explanatory text outside the JSON."""
 
-MEDIUM_MIRROR_USER_PROMPT = """Canonical Claim Model:
+MEDIUM_MIRROR_USER_PROMPT = """Generate mirrored CRM claims as JSON from \
+the Canonical Claim Model and system claims below.
+
+Canonical Claim Model:
 {canonical_model}
 
 System claims to mirror:
-{system_claims}
-
-Generate mirrored CRM claims as JSON."""
+{system_claims}"""
 
 
 # ---------------------------------------------------------------------------
@@ -242,10 +249,11 @@ Rules:
 5. Add explanatory notes for the reviewing attorney.
 6. Do not include preamble or explanatory text outside the JSON."""
 
-SCOPE_VALIDATOR_USER_PROMPT = """Canonical Claim Model:
+SCOPE_VALIDATOR_USER_PROMPT = """Validate scope consistency as JSON between \
+the Canonical Claim Model and independent claims below.
+
+Canonical Claim Model:
 {canonical_model}
 
 Independent claims to validate:
-{independent_claims}
-
-Validate scope consistency as JSON."""
+{independent_claims}"""
@@ -7,11 +7,17 @@ in ClaimGraph.canonical_model for audit purposes.
 
 from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 from src.drafting.schemas import ClaimNode
 
 
-class Actor(BaseModel):
+# The CCM sub-objects are read-only transport records that exist in large
+# numbers per request; slots-based pydantic dataclasses drop the per-instance
+# __dict__ while still validating and serializing like nested models.
+
+@dataclass(slots=True)
+class Actor:
     id: str = Field(..., description="Unique actor identifier (e.g., 'a1')")
     name: str = Field(..., description="Short noun phrase (e.g., 'processor', 'sensor module')")
     actor_type: Literal[
@@ -21,7 +27,8 @@ class Actor(BaseModel):
     description: str = Field("", description="What this actor does in the invention")
 
 
-class Action(BaseModel):
+@dataclass(slots=True)
+class Action:
     id: str = Field(..., description="Unique action identifier (e.g., 'act1')")
     verb: str = Field(..., description="Gerund or infinitive (e.g., 'receiving', 'compute')")
     object: str = Field(..., description="What the action operates on")
@@ -29,7 +36,8 @@ class Action(BaseModel):
     actor_id: str = Field(..., description="Actor performing this action")
 
 
-class DataFlow(BaseModel):
+@dataclass(slots=True)
+class DataFlow:
     source_actor_id: str
     target_actor_id: str
     data_description: str = Field(..., description="What data moves between actors")
@@ -0,0 +1,123 @@
+"""Drafting pipeline — spec generation with overlapped downstream analyses.
+
+Graph topology::
+
+    START → generate_spec ──→ re_evaluate_risk ──┐
+                         └──→ validate_qa ───────┴→ END
+
+Callers previously ran the spec, risk re-evaluation, and QA agents
+back-to-back, so their LLM latencies added up. Both downstream analyses
+consume the full spec text and nothing from each other, so once the spec
+lands they run concurrently — the pipeline pays the slower of the two
+instead of their sum, hiding one full LLM round-trip per run.
+"""
+
+import operator
+from typing import TypedDict, Annotated, Optional, List
+
+from langgraph.graph import StateGraph, END
+
+from src.agents.spec.agent import spec_agent
+from src.agents.qa.agent import qa_agent
+from src.agents.risk.re_evaluation_agent import risk_re_evaluation_agent
+from src.specs.schemas import SpecDocument
+from src.risk.schemas import RiskAnalysis
+from src.qa.schemas import QAReport
+
+
+class DraftingPipelineState(TypedDict):
+    brief_text: str
+    claim_text: str
+    risk_findings: str  # prior risk findings text fed to the spec drafter
+    document_context: str
+    spec_document: Optional[SpecDocument]
+    spec_text: Optional[str]
+    risk_analysis: Optional[RiskAnalysis]
+    qa_report: Optional[QAReport]
+    errors: Annotated[List[str], operator.add]
+
+
+def _format_spec_text(spec_document: SpecDocument) -> str:
+    """Render a SpecDocument as section-headed text for the analysis agents."""
+    parts = [f"# {spec_document.title}"]
+    current_section = None
+    for paragraph in spec_document.sections:
+        if paragraph.section != current_section:
+            parts.append(f"## {paragraph.section}")
+            current_section = paragraph.section
+        parts.append(paragraph.text)
+    return "\n\n".join(parts)
+
+
+def create_drafting_pipeline():
+    async def generate_spec_node(state: DraftingPipelineState):
+        sub = await spec_agent.ainvoke({
+            "brief_text": state["brief_text"],
+            "claim_text": state["claim_text"],
+            "risk_findings": state["risk_findings"],
+            "document_context": state.get("document_context", ""),
+            "spec_document": None,
+            "messages": [],
+            "errors": [],
+        })
+        if sub.get("errors"):
+            return {"errors": [f"Spec generation failed: {sub['errors']}"]}
+        spec_document: SpecDocument = sub["spec_document"]
+        return {
+            "spec_document": spec_document,
+            "spec_text": _format_spec_text(spec_document),
+        }
+
+    def _after_spec(state: DraftingPipelineState):
+        if state.get("errors"):
+            return END
+        return ["re_evaluate_risk", "validate_qa"]
+
+    async def re_evaluate_risk_node(state: DraftingPipelineState):
+        sub = await risk_re_evaluation_agent.ainvoke({
+            "claim_text": state["claim_text"],
+            "spec_text": state["spec_text"],
+            "previous_risk_findings": state["risk_findings"],
+            "document_context": state.get("document_context", ""),
+            "risk_analysis": None,
+            "messages": [],
+            "errors": [],
+            "category_results": [],
+        })
+        if sub.get("errors"):
+            return {"errors": [f"Risk re-evaluation failed: {sub['errors']}"]}
+        return {"risk_analysis": sub["risk_analysis"]}
+
+    async def validate_qa_node(state: DraftingPipelineState):
+        sub = await qa_agent.ainvoke({
+            "claim_text": state["claim_text"],
+            "spec_text": state["spec_text"],
+            "brief_text": state["brief_text"],
+            "document_context": state.get("document_context", ""),
+            "qa_report": None,
+            "messages": [],
+            "errors": [],
+        })
+        if sub.get("errors"):
+            return {"errors": [f"QA validation failed: {sub['errors']}"]}
+        return {"qa_report": sub["qa_report"]}
+
+    workflow = StateGraph(DraftingPipelineState)
+    workflow.add_node("generate_spec", generate_spec_node)
+    workflow.add_node("re_evaluate_risk", re_evaluate_risk_node)
+    workflow.add_node("validate_qa", validate_qa_node)
+
+    workflow.set_entry_point("generate_spec")
+    workflow.add_conditional_edges("generate_spec", _after_spec, {
+        "re_evaluate_risk": "re_evaluate_risk",
+        "validate_qa": "validate_qa",
+        END: END,
+    })
+    workflow.add_edge("re_evaluate_risk", END)
+    workflow.add_edge("validate_qa", END)
+
+    return workflow.compile()
+
+
+# Singleton instance accessor
+drafting_pipeline = create_drafting_pipeline()
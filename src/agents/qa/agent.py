@@ -1,12 +1,20 @@
+import logging
 from typing import TypedDict, Optional, List, Any
 
-from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import StateGraph, END
 
-from src.llm.factory import get_primary_llm
+from src.llm.factory import get_primary_llm, get_llm_semaphore, cacheable_system_message
 from src.qa.schemas import QAReport
 from src.agents.qa.prompts import QA_ANALYST_SYSTEM_PROMPT, QA_VALIDATION_USER_PROMPT
 
+logger = logging.getLogger(__name__)
+
+# Messages are built with plain str.format over module constants instead of
+# ChatPromptTemplate, which re-parses placeholder markers on every call. The
+# system prompt was written with template escaping, so its doubled braces are
+# unescaped once here.
+_SYSTEM_PROMPT = QA_ANALYST_SYSTEM_PROMPT.replace("{{", "{").replace("}}", "}")
+
 
 class QAAgentState(TypedDict):
     claim_text: str
@@ -18,32 +26,53 @@ class QAAgentState(TypedDict):
     errors: Optional[List[str]]
 
 
-def create_qa_agent():
+# The structured chain is cached and rebuilt only when the factory returns a
+# new LLM after a settings change — with_structured_output recompiles the
+# schema on every construction, and the system message's cache tagging
+# depends on the provider.
+_chain = None
+_chain_llm = None
+_system_message = None
+
+
+def _get_chain():
+    global _chain, _chain_llm, _system_message
     llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(QAReport)
+    if llm is not _chain_llm:
+        _system_message = cacheable_system_message(_SYSTEM_PROMPT, llm)
+        _chain = llm.with_structured_output(QAReport).with_retry(
+            wait_exponential_jitter=True, stop_after_attempt=3
+        )
+        _chain_llm = llm
+    return _chain
+
 
+def create_qa_agent():
     async def validate_qa_node(state: QAAgentState):
         claim_text = state["claim_text"]
         spec_text = state["spec_text"]
         brief_text = state["brief_text"]
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", QA_ANALYST_SYSTEM_PROMPT),
-            ("user", QA_VALIDATION_USER_PROMPT),
-        ])
-
-        chain = prompt | structured_llm
+        chain = _get_chain()
+        messages = [
+            _system_message,
+            ("user", QA_VALIDATION_USER_PROMPT.format(
+                claim_text=claim_text,
+                spec_text=spec_text,
+                brief_text=brief_text,
+                document_context=state.get("document_context", ""),
+            )),
+        ]
 
         try:
-            result: QAReport = await chain.ainvoke({
-                "claim_text": claim_text,
-                "spec_text": spec_text,
-                "brief_text": brief_text,
-                "document_context": state.get("document_context", ""),
-            })
+            async with get_llm_semaphore():
+                result: QAReport = await chain.ainvoke(messages)
             return {"qa_report": result, "errors": []}
         except Exception as e:
-            return {"errors": [str(e)]}
+            # Full traceback goes to the log; state carries a bounded summary
+            # so checkpointed payloads stay small.
+            logger.exception("QA validation failed")
+            return {"errors": [f"{type(e).__name__}: {str(e)[:500]}"]}
 
     workflow = StateGraph(QAAgentState)
     workflow.add_node("validate_qa", validate_qa_node)
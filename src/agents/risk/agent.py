@@ -1,12 +1,20 @@
+import logging
 from typing import TypedDict, Optional, List, Any
 
-from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import StateGraph, END
 
-from src.llm.factory import get_primary_llm
+from src.llm.factory import get_primary_llm, get_llm_semaphore, cacheable_system_message
 from src.risk.schemas import RiskAnalysis
 from src.agents.risk.prompts import RISK_ANALYST_SYSTEM_PROMPT, RISK_ANALYSIS_USER_PROMPT
 
+logger = logging.getLogger(__name__)
+
+# Messages are built with plain str.format over module constants instead of
+# ChatPromptTemplate, which re-parses placeholder markers on every call. The
+# system prompt was written with template escaping, so its doubled braces are
+# unescaped once here.
+_SYSTEM_PROMPT = RISK_ANALYST_SYSTEM_PROMPT.replace("{{", "{").replace("}}", "}")
+
 
 class RiskAgentState(TypedDict):
     claim_text: str
@@ -16,28 +24,48 @@ class RiskAgentState(TypedDict):
     errors: Optional[List[str]]
 
 
-def create_risk_agent():
+# The structured chain is cached and rebuilt only when the factory returns a
+# new LLM after a settings change; the system message's cache tagging depends
+# on the provider.
+_chain = None
+_chain_llm = None
+_system_message = None
+
+
+def _get_chain():
+    global _chain, _chain_llm, _system_message
     llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(RiskAnalysis)
+    if llm is not _chain_llm:
+        _system_message = cacheable_system_message(_SYSTEM_PROMPT, llm)
+        _chain = llm.with_structured_output(RiskAnalysis).with_retry(
+            wait_exponential_jitter=True, stop_after_attempt=3
+        )
+        _chain_llm = llm
+    return _chain
+
 
+def create_risk_agent():
     async def analyze_risk_node(state: RiskAgentState):
         claim_text = state["claim_text"]
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", RISK_ANALYST_SYSTEM_PROMPT),
-            ("user", RISK_ANALYSIS_USER_PROMPT),
-        ])
-
-        chain = prompt | structured_llm
+        chain = _get_chain()
+        messages = [
+            _system_message,
+            ("user", RISK_ANALYSIS_USER_PROMPT.format(
+                claim_text=claim_text,
+                document_context=state.get("document_context", ""),
+            )),
+        ]
 
         try:
-            result: RiskAnalysis = await chain.ainvoke({
-                "claim_text": claim_text,
-                "document_context": state.get("document_context", ""),
-            })
+            async with get_llm_semaphore():
+                result: RiskAnalysis = await chain.ainvoke(messages)
             return {"risk_analysis": result, "errors": []}
         except Exception as e:
-            return {"errors": [str(e)]}
+            # Full traceback goes to the log; state carries a bounded summary
+            # so checkpointed payloads stay small.
+            logger.exception("Risk analysis failed")
+            return {"errors": [f"{type(e).__name__}: {str(e)[:500]}"]}
 
     workflow = StateGraph(RiskAgentState)
     workflow.add_node("analyze_risk", analyze_risk_node)
@@ -0,0 +1,30 @@
+"""Shared building blocks for the risk re-evaluation prompts.
+
+The monolithic re-evaluation prompt and the per-category fan-out prompts
+describe the same seven risk categories. Keeping the descriptions in one
+place stops the two from drifting apart and keeps the shared text
+byte-identical across call sites — which is what provider-side prompt
+caches key on.
+
+The initial risk analysis prompt (prompts.py) deliberately keeps its own
+category wording: it evaluates claims in isolation, whereas these
+descriptions are spec-aware.
+"""
+
+# Keyed by RiskFinding.category. Each fan-out Send branch receives exactly
+# one entry, so its system prompt carries ~1/7th of the instruction payload.
+RISK_CATEGORY_DESCRIPTIONS = {
+    "functional_claiming": "Do functional claim elements now have corresponding structural disclosure in the specification? Has the spec provided algorithms, flowcharts, or implementation details that anchor functional language?",
+    "means_plus_function": "For any means-plus-function elements, does the specification disclose corresponding structure, material, or acts? Are there sufficient equivalents described?",
+    "ambiguous_terms": "Has the specification provided definitions or contextual clarity for previously flagged ambiguous terms? Are there new ambiguous terms introduced in the spec that affect claim scope?",
+    "lack_of_structural_support": "Does the specification provide adequate structural detail for each claim element? Are there claim elements that remain unsupported or insufficiently described?",
+    "section_101_eligibility": "Does the specification demonstrate a technical improvement or practical application that strengthens eligibility arguments? Has the spec provided enough technical detail to overcome abstractness concerns?",
+    "indefiniteness": "Has the specification resolved antecedent basis issues? Does it provide clear definitions that establish claim boundaries?",
+    "written_description": "Does the specification satisfy the written description requirement for ALL claim elements? Flag any claim element where the spec fails to show possession of the invention. Pay special attention to whether the spec narrows claim scope unintentionally.",
+}
+
+# The numbered list form used by the monolithic system prompt.
+CATEGORIES_BLOCK = "\n\n".join(
+    f"{i}. **{name}** — {description}"
+    for i, (name, description) in enumerate(RISK_CATEGORY_DESCRIPTIONS.items(), 1)
+)
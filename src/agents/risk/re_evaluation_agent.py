@@ -1,15 +1,23 @@
-from typing import TypedDict, Optional, List, Any
+import logging
+import operator
+from typing import TypedDict, Annotated, Optional, List, Any
 
-from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
 
-from src.llm.factory import get_primary_llm
+from src.llm.factory import get_primary_llm, get_secondary_llm, get_llm_semaphore
+from src.llm.cache import digest, get_or_compute
 from src.risk.schemas import RiskAnalysis
 from src.agents.risk.re_evaluation_prompts import (
-    RISK_RE_EVALUATION_SYSTEM_PROMPT,
+    RISK_RE_EVALUATION_CATEGORY_SYSTEM_PROMPT,
+    RISK_RE_EVALUATION_CATEGORY_DESCRIPTIONS,
     RISK_RE_EVALUATION_USER_PROMPT,
 )
 
+logger = logging.getLogger(__name__)
+
+RISK_CATEGORIES = tuple(RISK_RE_EVALUATION_CATEGORY_DESCRIPTIONS)
+
 
 class ReEvalAgentState(TypedDict):
     claim_text: str
@@ -18,40 +26,146 @@ class ReEvalAgentState(TypedDict):
     document_context: str
     risk_analysis: Optional[RiskAnalysis]
     messages: List[Any]
-    errors: Optional[List[str]]
+    errors: Annotated[List[str], operator.add]
+    # One entry per completed category branch, merged by the fan-in node
+    category_results: Annotated[List[RiskAnalysis], operator.add]
 
 
-def create_re_evaluation_agent():
-    llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(RiskAnalysis)
+class CategoryState(TypedDict):
+    """Payload handed to each Send branch — one risk category per branch."""
+    category: str
+    claim_text: str
+    spec_text: str
+    previous_risk_findings: str
+    document_context: str
 
-    async def re_evaluate_risk_node(state: ReEvalAgentState):
-        claim_text = state["claim_text"]
-        spec_text = state["spec_text"]
-        previous_risk_findings = state["previous_risk_findings"]
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", RISK_RE_EVALUATION_SYSTEM_PROMPT),
-            ("user", RISK_RE_EVALUATION_USER_PROMPT),
-        ])
+# Only seven fixed categories, so their system messages are rendered once at
+# import with str.format, which also resolves the doubled-brace JSON examples
+# the template carries. User messages are formatted the same way at call time
+# instead of going through ChatPromptTemplate's per-call parsing.
+_CATEGORY_SYSTEM_MESSAGES = {
+    category: ("system", RISK_RE_EVALUATION_CATEGORY_SYSTEM_PROMPT.format(
+        category=category,
+        category_description=description,
+    ))
+    for category, description in RISK_RE_EVALUATION_CATEGORY_DESCRIPTIONS.items()
+}
 
-        chain = prompt | structured_llm
+# Keyword/phrase-driven categories don't need the flagship reasoning model;
+# they route to the secondary engine, which is typically several times
+# faster and cheaper per call. Spec-support judgement calls stay on primary.
+_LIGHT_CATEGORIES = frozenset({
+    "ambiguous_terms",
+    "indefiniteness",
+    "means_plus_function",
+})
 
-        try:
-            result: RiskAnalysis = await chain.ainvoke({
-                "claim_text": claim_text,
-                "spec_text": spec_text,
-                "previous_risk_findings": previous_risk_findings,
+_chains: dict = {}
+_chain_llms: dict = {}
+
+
+def _get_chain(category: str):
+    role = "light" if category in _LIGHT_CATEGORIES else "heavy"
+    llm = get_secondary_llm() if role == "light" else get_primary_llm()
+    if _chain_llms.get(role) is not llm:
+        _chains[role] = llm.with_structured_output(RiskAnalysis).with_retry(
+            wait_exponential_jitter=True, stop_after_attempt=3
+        )
+        _chain_llms[role] = llm
+    return _chains[role]
+
+
+def create_re_evaluation_agent():
+    async def dispatch_node(state: ReEvalAgentState):
+        return {}
+
+    def dispatch_categories(state: ReEvalAgentState):
+        """Fan out one Send per risk category.
+
+        Each branch carries a category-specific system prompt (~1/7th of the
+        monolithic instruction payload), so end-to-end latency is the slowest
+        category instead of one long serial call.
+        """
+        return [
+            Send("analyze_category", {
+                "category": category,
+                "claim_text": state["claim_text"],
+                "spec_text": state["spec_text"],
+                "previous_risk_findings": state["previous_risk_findings"],
                 "document_context": state.get("document_context", ""),
             })
-            return {"risk_analysis": result, "errors": []}
+            for category in RISK_CATEGORIES
+        ]
+
+    async def analyze_category_node(state: CategoryState):
+        category = state["category"]
+        chain = _get_chain(category)
+
+        messages = [
+            _CATEGORY_SYSTEM_MESSAGES[category],
+            ("user", RISK_RE_EVALUATION_USER_PROMPT.format(
+                claim_text=state["claim_text"],
+                spec_text=state["spec_text"],
+                previous_risk_findings=state["previous_risk_findings"],
+                document_context=state["document_context"],
+            )),
+        ]
+
+        async def _analyze() -> RiskAnalysis:
+            async with get_llm_semaphore():
+                return await chain.ainvoke(messages)
+
+        try:
+            key = digest(
+                "risk-re-eval",
+                category,
+                state["claim_text"],
+                state["spec_text"],
+                state["previous_risk_findings"],
+                state["document_context"],
+            )
+            result = await get_or_compute(key, RiskAnalysis, _analyze)
+            return {"category_results": [result]}
         except Exception as e:
-            return {"errors": [str(e)]}
+            # A failed category is logged and dropped; the remaining branches
+            # still aggregate rather than failing the whole re-evaluation.
+            logger.warning("Risk re-evaluation category %s failed: %s", category, e)
+            return {"category_results": []}
+
+    async def aggregate_node(state: ReEvalAgentState):
+        results = state.get("category_results") or []
+        if not results:
+            return {"errors": ["All risk category analyses failed"]}
+
+        findings = []
+        scores: List[int] = []
+        summaries: List[str] = []
+        for result in results:
+            findings.extend(result.findings)
+            scores.append(result.defensibility_score)
+            if result.summary:
+                summaries.append(result.summary)
+
+        for i, finding in enumerate(findings, 1):
+            finding.id = f"R{i}"
+
+        merged = RiskAnalysis(
+            defensibility_score=round(sum(scores) / len(scores)),
+            findings=findings,
+            summary=" ".join(summaries),
+        )
+        return {"risk_analysis": merged}
 
     workflow = StateGraph(ReEvalAgentState)
-    workflow.add_node("re_evaluate_risk", re_evaluate_risk_node)
-    workflow.set_entry_point("re_evaluate_risk")
-    workflow.add_edge("re_evaluate_risk", END)
+    workflow.add_node("dispatch", dispatch_node)
+    workflow.add_node("analyze_category", analyze_category_node)
+    workflow.add_node("aggregate", aggregate_node)
+
+    workflow.set_entry_point("dispatch")
+    workflow.add_conditional_edges("dispatch", dispatch_categories)
+    workflow.add_edge("analyze_category", "aggregate")
+    workflow.add_edge("aggregate", END)
 
     return workflow.compile()
 
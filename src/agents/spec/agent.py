@@ -1,12 +1,15 @@
+import logging
 from typing import TypedDict, Optional, List, Any
 
-from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import StateGraph, END
 
-from src.llm.factory import get_primary_llm
+from src.llm.factory import get_primary_llm, get_llm_semaphore, cacheable_system_message
+from src.llm.cache import digest, get_or_compute
 from src.specs.schemas import SpecDocument
 from src.agents.spec.prompts import SPEC_DRAFTER_SYSTEM_PROMPT, SPEC_DRAFTING_USER_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 class SpecAgentState(TypedDict):
     brief_text: str
@@ -18,32 +21,59 @@ class SpecAgentState(TypedDict):
     errors: Optional[List[str]]
 
 
-def create_spec_agent():
+# The structured chain is cached and rebuilt only when the factory returns a
+# new LLM after a settings change; the system message's cache tagging depends
+# on the provider. User messages are built with plain str.format instead of
+# ChatPromptTemplate, which re-parses placeholder markers on every call.
+_chain = None
+_chain_llm = None
+_system_message = None
+
+
+def _get_chain():
+    global _chain, _chain_llm, _system_message
     llm = get_primary_llm()
-    structured_llm = llm.with_structured_output(SpecDocument)
+    if llm is not _chain_llm:
+        _system_message = cacheable_system_message(SPEC_DRAFTER_SYSTEM_PROMPT, llm)
+        _chain = llm.with_structured_output(SpecDocument).with_retry(
+            wait_exponential_jitter=True, stop_after_attempt=3
+        )
+        _chain_llm = llm
+    return _chain
 
+
+def create_spec_agent():
     async def generate_spec_node(state: SpecAgentState):
         brief_text = state["brief_text"]
         claim_text = state["claim_text"]
         risk_findings = state["risk_findings"]
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", SPEC_DRAFTER_SYSTEM_PROMPT),
-            ("user", SPEC_DRAFTING_USER_PROMPT),
-        ])
+        chain = _get_chain()
+        document_context = state.get("document_context", "")
+
+        messages = [
+            _system_message,
+            ("user", SPEC_DRAFTING_USER_PROMPT.format(
+                brief_text=brief_text,
+                claim_text=claim_text,
+                risk_findings=risk_findings,
+                document_context=document_context,
+            )),
+        ]
 
-        chain = prompt | structured_llm
+        async def _generate() -> SpecDocument:
+            async with get_llm_semaphore():
+                return await chain.ainvoke(messages)
 
         try:
-            result: SpecDocument = await chain.ainvoke({
-                "brief_text": brief_text,
-                "claim_text": claim_text,
-                "risk_findings": risk_findings,
-                "document_context": state.get("document_context", ""),
-            })
+            key = digest("spec", brief_text, claim_text, risk_findings, document_context)
+            result = await get_or_compute(key, SpecDocument, _generate)
             return {"spec_document": result, "errors": []}
         except Exception as e:
-            return {"errors": [str(e)]}
+            # Full traceback goes to the log; state carries a bounded summary
+            # so checkpointed payloads stay small.
+            logger.exception("Spec generation failed")
+            return {"errors": [f"{type(e).__name__}: {str(e)[:500]}"]}
 
     workflow = StateGraph(SpecAgentState)
     workflow.add_node("generate_spec", generate_spec_node)
@@ -1,6 +1,6 @@
 import operator
 from typing import TypedDict, Annotated, Optional, Dict, Any, List
-from src.drafting.schemas import ClaimGraph
+from src.drafting.schemas import ClaimGraph, ClaimNode
 
 
 class AgentState(TypedDict):
@@ -19,8 +19,9 @@ class ClaimsAgentState(TypedDict):
     errors: Annotated[List[str], operator.add]
     # Pipeline intermediates
     canonical_model: Optional[Dict[str, Any]]
-    system_claim_nodes: Optional[List[Dict[str, Any]]]
-    method_claim_nodes: Optional[List[Dict[str, Any]]]
-    medium_claim_nodes: Optional[List[Dict[str, Any]]]
-    all_independent_nodes: Optional[List[Dict[str, Any]]]
+    canonical_model_json: Optional[str]
+    system_claim_nodes: Optional[List[ClaimNode]]
+    method_claim_nodes: Optional[List[ClaimNode]]
+    medium_claim_nodes: Optional[List[ClaimNode]]
+    all_independent_nodes: Optional[List[ClaimNode]]
     scope_validation: Optional[Dict[str, Any]]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Integer, Boolean
+from sqlalchemy import Column, String, ForeignKey, Integer, Boolean, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from src.database import Base
@@ -6,7 +6,14 @@ from src.shared.models import AuditMixin
 
 class BriefVersion(Base, AuditMixin):
     __tablename__ = "brief_versions"
-    
+
+    # Upload dedupe looks up (matter_id, source_material_hash); version
+    # numbering runs MAX(version_number) per matter as an index-only scan.
+    __table_args__ = (
+        Index("ix_brief_versions_matter_hash", "matter_id", "source_material_hash"),
+        Index("ix_brief_versions_matter_version", "matter_id", "version_number"),
+    )
+
     matter_id = Column(ForeignKey("matters.id"), nullable=False, index=True)
     version_number = Column(Integer, nullable=False)
     source_material_hash = Column(String, nullable=True) # SHA-256 for change detection
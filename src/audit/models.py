@@ -4,7 +4,7 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 from src.database import Base
-from src.shared.models import AuditMixin
+from src.shared.models import AuditMixin, uuid7
 
 
 class AuditEventType(str, Enum):
@@ -29,6 +29,9 @@ class AuditEventType(str, Enum):
 class AuditEvent(Base, AuditMixin):
     __tablename__ = "audit_events"
 
+    # Time-ordered v7 ids keep the append-only PK index right-growing
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+
     matter_id = Column(ForeignKey("matters.id"), nullable=False, index=True)
     event_type = Column(SAEnum(AuditEventType), nullable=False)
     actor_id = Column(ForeignKey("users.id"), nullable=True)
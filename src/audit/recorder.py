@@ -0,0 +1,66 @@
+"""Background audit event writer.
+
+Some endpoints commit an AuditEvent as the *only* write on the response path
+(e.g. export downloads), which adds a full DB round-trip to user-visible
+latency. The recorder queues those events in-process; a single worker
+coroutine drains the queue and batches waiting rows into one INSERT per
+flush window.
+
+Audit writes that share a transaction with the artifact they describe stay
+inline in the services — backgrounding those would break audit/artifact
+atomicity.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy import insert
+
+from src.audit.models import AuditEvent
+from src.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_WINDOW_SECONDS = 0.05
+_FLUSH_MAX_ROWS = 100
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+
+def record_audit_event(**values: Any) -> None:
+    """Queue an AuditEvent (given as column values) for background insertion.
+
+    Returns immediately; the write happens off the request path. The worker
+    is started lazily on the running loop the first time this is called.
+    """
+    global _queue, _worker
+    if _queue is None:
+        _queue = asyncio.Queue()
+    if _worker is None or _worker.done():
+        _worker = asyncio.get_running_loop().create_task(_drain())
+    _queue.put_nowait(values)
+
+
+async def _drain() -> None:
+    while True:
+        rows: list[Dict[str, Any]] = [await _queue.get()]
+        # Collect whatever else arrives within the flush window so bursts
+        # become one batched INSERT instead of N tiny ones.
+        try:
+            while len(rows) < _FLUSH_MAX_ROWS:
+                rows.append(
+                    await asyncio.wait_for(_queue.get(), timeout=_FLUSH_WINDOW_SECONDS)
+                )
+        except asyncio.TimeoutError:
+            pass
+
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(AuditEvent), rows)
+                await session.commit()
+        except Exception:
+            # Audit logging must never take down the worker; drop the batch
+            # with a full log entry rather than retrying into a stuck DB.
+            logger.exception("Failed to write %d audit event(s)", len(rows))
@@ -1,17 +1,54 @@
+import asyncio
+import time
+from typing import Dict, FrozenSet, Tuple
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 
 from src.database import get_db
 from src.config import settings
 from src.auth import security, models
+from src.auth.models import group_permissions, user_groups
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# Short-TTL per-user permission cache. Permission assignments change rarely
+# (admin actions), so a 60s window of staleness is an acceptable trade for
+# skipping the permission query on every authenticated request.
+_perm_cache: Dict[UUID, Tuple[float, FrozenSet[str]]] = {}
+_PERM_CACHE_MAX = 1024
+_PERM_TTL_SECONDS = 60
+
+
+def clear_permission_cache() -> None:
+    """Drop cached permission sets (call after changing group membership)."""
+    _perm_cache.clear()
+
+
+async def get_permission_set(db: AsyncSession, user_id: UUID) -> FrozenSet[str]:
+    """Return the user's permission codenames via a single JOIN query."""
+    now = time.monotonic()
+    entry = _perm_cache.get(user_id)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    result = await db.execute(
+        select(models.Permission.codename)
+        .join(group_permissions, group_permissions.c.permission_id == models.Permission.id)
+        .join(user_groups, user_groups.c.group_id == group_permissions.c.group_id)
+        .where(user_groups.c.user_id == user_id)
+        .distinct()
+    )
+    perm_set = frozenset(result.scalars().all())
+
+    if len(_perm_cache) >= _PERM_CACHE_MAX:
+        _perm_cache.pop(next(iter(_perm_cache)))
+    _perm_cache[user_id] = (now + _PERM_TTL_SECONDS, perm_set)
+    return perm_set
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -23,17 +60,20 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[security.ALGORITHM])
+        # Signature verification is CPU-bound; run it off the event loop so
+        # concurrent requests aren't serialized behind it.
+        payload = await asyncio.to_thread(
+            jwt.decode, token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+        )
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    # Eager load groups and permissions for RBAC
-    query = select(models.User).where(models.User.email == email).options(
-        selectinload(models.User.groups).selectinload(models.Group.permissions)
-    )
+    # Permission checks go through get_permission_set, so the user row is
+    # loaded on its own — no per-request selectinload of groups/permissions.
+    query = select(models.User).where(models.User.email == email)
     result = await db.execute(query)
     user = result.scalars().first()
 
@@ -56,17 +96,13 @@ class CheckPermission:
     def __init__(self, codename: str):
         self.codename = codename
 
-    async def __call__(self, user: models.User = Depends(get_current_active_user)):
-        has_perm = False
-        for group in user.groups:
-            for permission in group.permissions:
-                if permission.codename == self.codename:
-                    has_perm = True
-                    break
-            if has_perm:
-                break
-
-        if not has_perm:
+    async def __call__(
+        self,
+        user: models.User = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db),
+    ):
+        perm_set = await get_permission_set(db, user.id)
+        if self.codename not in perm_set:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Missing permission: {self.codename}",
@@ -87,13 +123,14 @@ async def require_tenant_matter(
     """
     from src.matter.models import Matter
 
+    # Existence check only — select just the id rather than hydrating the
+    # full Matter row on every guarded request.
     result = await db.execute(
-        select(Matter).where(
+        select(Matter.id).where(
             Matter.id == matter_id,
             Matter.tenant_id == current_user.tenant_id,
-        )
+        ).limit(1)
     )
-    matter = result.scalars().first()
-    if not matter:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Matter not found")
     return current_user
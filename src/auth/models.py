@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Boolean, Table, Integer, DateTime
+from sqlalchemy import Column, String, ForeignKey, Boolean, Table, Integer, DateTime, Index
 from sqlalchemy.orm import relationship
 from src.database import Base
 from src.shared.models import AuditMixin
@@ -39,7 +39,7 @@ class Group(Base, AuditMixin):
     __tablename__ = "groups"
 
     name = Column(String, nullable=False)
-    tenant_id = Column(ForeignKey("tenants.id"), nullable=False)
+    tenant_id = Column(ForeignKey("tenants.id"), nullable=False, index=True)
 
     tenant = relationship("Tenant", back_populates="groups")
     permissions = relationship("Permission", secondary=group_permissions)
@@ -47,12 +47,17 @@ class Group(Base, AuditMixin):
 
 class User(Base, AuditMixin):
     __tablename__ = "users"
-    
+
+    # Tenant-scoped user lookups filter (tenant_id, email)
+    __table_args__ = (
+        Index("ix_users_tenant_email", "tenant_id", "email"),
+    )
+
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=True)
     full_name = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
-    tenant_id = Column(ForeignKey("tenants.id"), nullable=False)
+    tenant_id = Column(ForeignKey("tenants.id"), nullable=False, index=True)
     
     tenant = relationship("Tenant", back_populates="users")
     groups = relationship("Group", secondary=user_groups, back_populates="users")
@@ -68,11 +73,18 @@ class Invitation(Base, AuditMixin):
     
     code = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, index=True, nullable=False)
-    tenant_id = Column(ForeignKey("tenants.id"), nullable=False)
+    tenant_id = Column(ForeignKey("tenants.id"), nullable=False, index=True)
     group_id = Column(ForeignKey("groups.id"), nullable=True) # Role to assign
     inviter_id = Column(ForeignKey("users.id"), nullable=False)
     expires_at = Column(DateTime, nullable=False)
-    status = Column(String, default="PENDING", nullable=False) # PENDING, ACCEPTED, EXPIRED
+    status = Column(String, default="PENDING", nullable=False, index=True) # PENDING, ACCEPTED, EXPIRED
+
+    # Pending-invite lookups filter on (email, status); expiry reaping scans
+    # (expires_at, status) as a range — both seq-scan without these.
+    __table_args__ = (
+        Index("ix_invitations_email_status", "email", "status"),
+        Index("ix_invitations_expires_status", "expires_at", "status"),
+    )
 
     tenant = relationship("Tenant")
     group = relationship("Group")
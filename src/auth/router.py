@@ -8,7 +8,7 @@ from src.auth import schemas, models, security
 from src.auth.service import AuthService
 from src.config import settings
 
-from src.auth.dependencies import get_current_user, CheckPermission
+from src.auth.dependencies import get_current_user, CheckPermission, get_permission_set
 
 router = APIRouter()
 
@@ -34,7 +34,11 @@ async def login_access_token(
         )
     elif not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    
+
+    # Warm the permission cache while we're here so the first guarded
+    # request after login skips its JOIN.
+    await get_permission_set(db, user.id)
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = security.create_access_token(
         data={"sub": user.email, "tenant_id": str(user.tenant_id)},
@@ -1,16 +1,35 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 import secrets
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from passlib.context import CryptContext
 
 from src.auth import models, schemas, security
+from src.database import AsyncSessionLocal
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min_rounds matches the cost bcrypt.gensalt() currently produces; hashes
+# minted at a lower cost are flagged by needs_update and rehashed on login.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__min_rounds=12)
+
+# Strong refs to in-flight rehash tasks so they aren't garbage-collected
+_rehash_tasks: set = set()
+
+
+async def _rehash_and_save(user_id: UUID, password: str) -> None:
+    """Re-hash a verified password at the current cost and store it."""
+    new_hash = await asyncio.to_thread(security.get_password_hash, password)
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(models.User)
+            .where(models.User.id == user_id)
+            .values(hashed_password=new_hash)
+        )
+        await session.commit()
 
 class AuthService:
     def __init__(self, db: AsyncSession):
@@ -24,12 +43,29 @@ class AuthService:
         user = await self.get_user_by_email(email)
         if not user:
             return None
-        if not security.verify_password(password, user.hashed_password):
+        # bcrypt verification costs hundreds of milliseconds by design; run
+        # it in the threadpool so concurrent logins don't serialize the loop.
+        if not await asyncio.to_thread(
+            security.verify_password, password, user.hashed_password
+        ):
             return None
+
+        # Opportunistic rehash: if the stored hash predates the current cost
+        # parameters, upgrade it off the request path so login stays fast
+        # while the hash corpus migrates transparently.
+        if pwd_context.needs_update(user.hashed_password):
+            task = asyncio.get_running_loop().create_task(
+                _rehash_and_save(user.id, password)
+            )
+            _rehash_tasks.add(task)
+            task.add_done_callback(_rehash_tasks.discard)
+
         return user
 
     async def create_user(self, user_create: schemas.UserCreate) -> models.User:
-        hashed_password = security.get_password_hash(user_create.password)
+        hashed_password = await asyncio.to_thread(
+            security.get_password_hash, user_create.password
+        )
         db_user = models.User(
             email=user_create.email,
             hashed_password=hashed_password,
@@ -47,8 +83,9 @@ class AuthService:
         if existing_user:
             raise ValueError("User with this email already exists")
 
-        # Generate secure code
-        code = secrets.token_urlsafe(32)
+        # Generate secure code — 128 bits is cryptographically ample for a
+        # single-use, 7-day token and keeps the unique-index key short.
+        code = secrets.token_urlsafe(16)
         expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=7)
 
         invitation = models.Invitation(
@@ -75,19 +112,41 @@ class AuthService:
         if invitation.status != "PENDING":
             raise ValueError("Invitation is no longer valid")
             
+        # Read-only check: validation sits behind a public GET, so it must
+        # not write. Stale rows are flipped in bulk by
+        # expire_stale_invitations instead of one commit per lookup.
         if invitation.expires_at.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc):
-            invitation.status = "EXPIRED"
-            await self.db.commit()
             raise ValueError("Invitation has expired")
-            
+
         return invitation
 
+    async def expire_stale_invitations(self) -> int:
+        """Mark all pending invitations past their deadline as EXPIRED.
+
+        One bulk UPDATE over the (expires_at, status) index; returns the
+        number of rows flipped. Meant to be run periodically by an
+        operator task rather than on the validation hot path.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        result = await self.db.execute(
+            update(models.Invitation)
+            .where(
+                models.Invitation.status == "PENDING",
+                models.Invitation.expires_at < now,
+            )
+            .values(status="EXPIRED")
+        )
+        await self.db.commit()
+        return result.rowcount
+
     async def register_with_invitation(self, register_data: schemas.UserRegister) -> models.User:
         # validate invite again
         invitation = await self.validate_invitation(register_data.invite_code)
         
         # create user
-        hashed_password = security.get_password_hash(register_data.password)
+        hashed_password = await asyncio.to_thread(
+            security.get_password_hash, register_data.password
+        )
         user = models.User(
             email=invitation.email,
             hashed_password=hashed_password,
@@ -3,7 +3,7 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from langgraph.graph import StateGraph, END
 from pydantic import BaseModel, Field
 
-from src.llm import get_primary_llm
+from src.llm import get_primary_llm, get_llm_semaphore
 
 # --- 1. State Definition ---
 class SBDState(TypedDict):
@@ -54,18 +54,23 @@ class BriefStructure(BaseModel):
 
 # --- 3. Node Logic ---
 
-def analyze_brief_node(state: SBDState):
-    """
-    Analyzes the raw text and extracts the structured brief.
-    """
-    print("--- SBD: Analyzing Brief ---")
-    text = state["text"]
-    
-    # Initialize LLM with structured output
+# The structured chain is cached and rebuilt only when the factory returns a
+# new LLM after a settings change — with_structured_output recompiles the
+# Pydantic JSON schema on every construction, which is pure waste per upload.
+_chain = None
+_chain_llm = None
+
+
+def _get_chain():
+    global _chain, _chain_llm
     llm = get_primary_llm()
-    
-    # Simple Prompt
-    system_prompt = """You are an expert Patent Engineer. Your task is to perform a Structured Brief Decomposition (SBD) on the provided invention disclosure text.
+    if llm is not _chain_llm:
+        _chain = llm.with_structured_output(BriefStructure)
+        _chain_llm = llm
+    return _chain
+
+
+_SYSTEM_PROMPT = """You are an expert Patent Engineer. Your task is to perform a Structured Brief Decomposition (SBD) on the provided invention disclosure text.
     
     Analyze the text and extract the following structured information in strict JSON format:
     1. Core Invention Statement: A single sentence summarizing the "point of novelty".
@@ -82,39 +87,48 @@ def analyze_brief_node(state: SBDState):
     
     Return ONLY VALID JSON matching this structure.
     """
-    
-    # Build the human message with text and any detected figures
-    human_content = f"Invention Disclosure Text:\n{text}"
+
+
+async def analyze_brief_node(state: SBDState):
+    """
+    Analyzes the raw text and extracts the structured brief.
+    """
+    print("--- SBD: Analyzing Brief ---")
+    text = state["text"]
+
+    # Build the human message with text and any detected figures; assembled
+    # as parts and joined once rather than concatenating growing strings.
+    parts = [f"Invention Disclosure Text:\n{text}"]
 
     figure_analyses = state.get("figure_analyses") or []
     if figure_analyses:
-        figure_descriptions = []
-        for fig in figure_analyses:
-            components = ", ".join(fig.get("extracted_components", []))
-            figure_descriptions.append(
-                f"- Page {fig['page_number']} ({fig.get('figure_id', 'unknown')}): "
-                f"{fig.get('type', 'diagram')} — {fig.get('description', 'No description')}. "
-                f"Components: {components}"
-            )
-        human_content += (
-            "\n\nDiagrams/Figures detected in the document:\n"
-            + "\n".join(figure_descriptions)
+        figure_descriptions = "\n".join(
+            f"- Page {fig['page_number']} ({fig.get('figure_id', 'unknown')}): "
+            f"{fig.get('type', 'diagram')} — {fig.get('description', 'No description')}. "
+            f"Components: {', '.join(fig.get('extracted_components', []))}"
+            for fig in figure_analyses
+        )
+        parts.append(
+            "Diagrams/Figures detected in the document:\n"
+            + figure_descriptions
             + "\n\nUse these diagram analyses to populate the figures_detected field accurately."
         )
 
+    human_content = "\n\n".join(parts)
+
     messages = [
-        SystemMessage(content=system_prompt),
+        SystemMessage(content=_SYSTEM_PROMPT),
         HumanMessage(content=human_content)
     ]
-    
+
     try:
         # We use .with_structured_output if supported, or just strict JSON mode + Pydantic validation
         # For Ollama JSON mode, it returns a string we need to parse, or we can use the experimental wrapper.
         # Let's try standard invoke with json format first using Pydantic to validate.
-        
-        structured_llm = llm.with_structured_output(BriefStructure)
-        result = structured_llm.invoke(messages)
-        
+
+        async with get_llm_semaphore():
+            result = await _get_chain().ainvoke(messages)
+
         # Result should be a BriefStructure object
         return {"brief_data": result.model_dump()}
         
@@ -1,7 +1,7 @@
 from typing import List, Any, Dict, Optional
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, ConfigDict
 
@@ -25,6 +25,18 @@ class BriefVersionResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BriefVersionSummaryResponse(BaseModel):
+    """List-view projection — everything but the structure_data blob."""
+    id: UUID
+    matter_id: UUID
+    version_number: int
+    source_material_hash: Optional[str]
+    is_authoritative: bool
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 @router.post("/{matter_id}/briefs/upload")
 async def upload_brief(
     matter_id: UUID,
@@ -66,15 +78,17 @@ async def approve_brief(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{matter_id}/briefs/versions", response_model=List[BriefVersionResponse])
+@router.get("/{matter_id}/briefs/versions", response_model=List[BriefVersionSummaryResponse])
 async def list_brief_versions(
     matter_id: UUID,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(require_tenant_matter),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all brief versions for a matter."""
+    """List brief versions for a matter (summaries, newest first)."""
     service = BriefingService(db)
-    return await service.list_brief_versions(matter_id)
+    return await service.list_brief_versions(matter_id, limit=limit, offset=offset)
 
 
 @router.get("/{matter_id}/briefs/{version_id}", response_model=BriefVersionResponse)
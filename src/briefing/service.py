@@ -1,8 +1,9 @@
+import asyncio
 from uuid import UUID
 from typing import Optional
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func, update
 
 from src.ingestion.service import IngestionService
 from src.briefing.agent import sbd_agent
@@ -22,28 +23,31 @@ class BriefingService:
         Attorney approves a brief version, making it authoritative.
         This confirms the structured breakdown is correct before claims generation.
         """
-        result = await self.db.execute(
-            select(BriefVersion).where(
-                BriefVersion.id == version_id,
-                BriefVersion.matter_id == matter_id,
+        # Flag + existence check in one statement; RETURNING hands back the
+        # updated row so no preliminary SELECT or post-commit refresh needed.
+        version = (
+            await self.db.execute(
+                update(BriefVersion)
+                .where(
+                    BriefVersion.id == version_id,
+                    BriefVersion.matter_id == matter_id,
+                )
+                .values(is_authoritative=True)
+                .returning(BriefVersion)
             )
-        )
-        version = result.scalar_one_or_none()
+        ).scalar_one_or_none()
         if not version:
             raise ValueError(f"Brief version {version_id} not found for matter {matter_id}")
 
-        version.is_authoritative = True
-
         # Update workstream pointer to the approved version
-        ws_result = await self.db.execute(
-            select(Workstream).where(
+        await self.db.execute(
+            update(Workstream)
+            .where(
                 Workstream.matter_id == matter_id,
                 Workstream.workstream_type == WorkstreamTypeEnum.DRAFTING_APPLICATION,
-            ).limit(1)
+            )
+            .values(active_brief_version_id=version.id)
         )
-        workstream = ws_result.scalar_one_or_none()
-        if workstream:
-            workstream.active_brief_version_id = version.id
 
         # Audit event
         self.db.add(AuditEvent(
@@ -55,7 +59,6 @@ class BriefingService:
         ))
 
         await self.db.commit()
-        await self.db.refresh(version)
         return version
 
     async def get_brief_version(self, matter_id: UUID, version_id: UUID) -> Optional[BriefVersion]:
@@ -68,14 +71,28 @@ class BriefingService:
         )
         return result.scalar_one_or_none()
 
-    async def list_brief_versions(self, matter_id: UUID):
-        """List all brief versions for a matter."""
+    async def list_brief_versions(self, matter_id: UUID, limit: int = 50, offset: int = 0):
+        """List brief versions for a matter — summary columns only.
+
+        structure_data can run to hundreds of KB per version; the list view
+        never shows it, so only the summary projection is fetched and the
+        result is paginated.
+        """
         result = await self.db.execute(
-            select(BriefVersion).where(
+            select(
+                BriefVersion.id,
+                BriefVersion.matter_id,
+                BriefVersion.version_number,
+                BriefVersion.source_material_hash,
+                BriefVersion.is_authoritative,
+                BriefVersion.created_at,
+            ).where(
                 BriefVersion.matter_id == matter_id,
             ).order_by(desc(BriefVersion.version_number))
+            .limit(limit)
+            .offset(offset)
         )
-        return list(result.scalars().all())
+        return result.all()
 
     async def process_brief_upload(self, matter_id: UUID, file: UploadFile, workstream_id: UUID | None = None):
         """
@@ -85,16 +102,36 @@ class BriefingService:
         4. Updates Matter/Workstream
         """
         # A. Read File
+        # CPU-bound ingestion work (hashing, PDF parsing, page rasterization)
+        # runs in the threadpool so large uploads don't stall the event loop.
         content = await file.read()
-        file_hash = self.ingestion.calculate_hash(content)
-        
-        # B. Check for existing processing (Optional Optimization - user didn't ask for dedupe yet)
-        
+        file_hash = await asyncio.to_thread(self.ingestion.calculate_hash, content)
+
+        # B. Dedupe on content hash: re-uploading the same material would
+        # re-run the full SBD agent pass only to produce identical
+        # structure_data, so return the version that already analyzed it.
+        stmt_dup = (
+            select(BriefVersion)
+            .where(
+                BriefVersion.matter_id == matter_id,
+                BriefVersion.source_material_hash == file_hash,
+            )
+            .order_by(desc(BriefVersion.version_number))
+            .limit(1)
+        )
+        existing = (await self.db.execute(stmt_dup)).scalar_one_or_none()
+        if existing is not None:
+            return existing
+
         # C. Extract Text
-        text = self.ingestion.extract_text(content, file.filename)
+        text = await asyncio.to_thread(
+            self.ingestion.extract_text, content, file.filename
+        )
 
         # C2. Extract and analyze diagrams/figures
-        images = self.ingestion.extract_images(content, file.filename)
+        images = await asyncio.to_thread(
+            self.ingestion.extract_images, content, file.filename
+        )
         figure_analyses = await analyze_figures(images)
 
         # D. Run SBD Agent
@@ -113,13 +150,13 @@ class BriefingService:
         
         # E. Determine Version Number
         # (This logic is repeated, could be a shared mixin later)
-        stmt = select(BriefVersion).where(
-            BriefVersion.matter_id == matter_id
-        ).order_by(desc(BriefVersion.version_number)).limit(1)
-        
-        result = await self.db.execute(stmt)
-        latest_version = result.scalar_one_or_none()
-        next_version = (latest_version.version_number + 1) if latest_version else 1
+        # MAX aggregate instead of fetching the full latest row for one int.
+        next_version = (
+            await self.db.execute(
+                select(func.coalesce(func.max(BriefVersion.version_number), 0) + 1)
+                .where(BriefVersion.matter_id == matter_id)
+            )
+        ).scalar_one()
         
         # F. Save BriefVersion
         new_version = BriefVersion(
@@ -1,7 +1,10 @@
-from typing import List
+import asyncio
+import json
+from typing import List, Optional
+
 from langchain_core.messages import HumanMessage
 
-from src.llm.factory import get_vision_llm
+from src.llm.factory import get_vision_llm, get_llm_semaphore
 
 FIGURE_ANALYSIS_PROMPT = """Analyze this page from a patent inventor brief document.
 
@@ -18,11 +21,52 @@ FIGURE_ANALYSIS_PROMPT = """Analyze this page from a patent inventor brief docum
 Respond ONLY with valid JSON, no other text."""
 
 
+async def _analyze_page(llm, img: dict) -> Optional[dict]:
+    """Analyze one page image; returns figure data (without figure_id) or None."""
+    message = HumanMessage(
+        content=[
+            {"type": "text", "text": FIGURE_ANALYSIS_PROMPT},
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:image/png;base64,{img['image_base64']}",
+                },
+            },
+        ]
+    )
+
+    try:
+        async with get_llm_semaphore():
+            response = await llm.ainvoke([message])
+        content = response.content.strip()
+        # Handle markdown code fences if the LLM wraps its output
+        if content.startswith("```"):
+            content = content.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+        data = json.loads(content)
+
+        if data.get("has_figure"):
+            return {
+                "page_number": img["page_number"],
+                "type": data.get("type", "other"),
+                "description": data.get("description", ""),
+                "extracted_components": data.get("extracted_components", []),
+            }
+    except Exception as e:
+        # Skip pages where vision analysis fails — don't block the pipeline
+        print(f"Vision analysis failed for page {img['page_number']}: {e}")
+    return None
+
+
 async def analyze_figures(images: list[dict]) -> list[dict]:
     """
     Analyze extracted page images using the vision LLM to identify and
     describe diagrams/figures.
 
+    Pages are analyzed concurrently (bounded by the shared LLM semaphore),
+    so a many-page brief costs roughly one call's latency instead of the
+    sum of all calls. Figure IDs are assigned after the fan-out, in page
+    order, so they stay deterministic.
+
     Args:
         images: List of dicts with keys "page_number", "image_bytes", "image_base64".
 
@@ -34,44 +78,11 @@ async def analyze_figures(images: list[dict]) -> list[dict]:
         return []
 
     llm = get_vision_llm()
-    results = []
-    figure_count = 0
-
-    for img in images:
-        message = HumanMessage(
-            content=[
-                {"type": "text", "text": FIGURE_ANALYSIS_PROMPT},
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/png;base64,{img['image_base64']}",
-                    },
-                },
-            ]
-        )
-
-        try:
-            response = await llm.ainvoke([message])
-            # Parse JSON from the response
-            import json
-            content = response.content.strip()
-            # Handle markdown code fences if the LLM wraps its output
-            if content.startswith("```"):
-                content = content.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
-            data = json.loads(content)
-
-            if data.get("has_figure"):
-                figure_count += 1
-                results.append({
-                    "page_number": img["page_number"],
-                    "figure_id": f"FIG-{figure_count:02d}",
-                    "type": data.get("type", "other"),
-                    "description": data.get("description", ""),
-                    "extracted_components": data.get("extracted_components", []),
-                })
-        except Exception as e:
-            # Skip pages where vision analysis fails — don't block the pipeline
-            print(f"Vision analysis failed for page {img['page_number']}: {e}")
-            continue
+    analyses = await asyncio.gather(*[_analyze_page(llm, img) for img in images])
 
+    results = []
+    for data in analyses:
+        if data is not None:
+            data["figure_id"] = f"FIG-{len(results) + 1:02d}"
+            results.append(data)
     return results
@@ -0,0 +1,107 @@
+"""Per-matter semantic cache for chat RAG retrieval.
+
+Chat questions cluster heavily — users rephrase the same query or re-ask it
+after a page reload — yet every call re-embeds the message and runs the
+hybrid pgvector/FTS search. This module caches retrieval results per matter
+with two lookup tiers:
+
+1. Exact: sha256 of the normalised message (plus page filter) — free, no
+   embedding call at all.
+2. Semantic: cosine similarity of the query embedding against cached query
+   embeddings — skips the ANN + FTS round-trip for near-duplicate phrasings.
+
+Entries are capped per matter with FIFO eviction, expire after a short TTL,
+and are invalidated wholesale for a matter when a new document finishes
+processing (stale context is worse than a cold cache).
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+_TTL_SECONDS = 300
+_MAX_PER_MATTER = 128
+_SIMILARITY_THRESHOLD = 0.95
+
+# Cache key: (digest of normalised message, page_filter).
+_Key = Tuple[str, Optional[int]]
+# Entry: (monotonic timestamp, unit-norm query embedding, context_text, references).
+_Entry = Tuple[float, np.ndarray, str, List[dict]]
+
+_cache: Dict[UUID, "OrderedDict[_Key, _Entry]"] = {}
+
+
+def exact_key(user_message: str, page_filter: Optional[int]) -> _Key:
+    digest = hashlib.sha256(user_message.lower().strip().encode("utf-8")).hexdigest()
+    return (digest, page_filter)
+
+
+def _unit(embedding: List[float]) -> np.ndarray:
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+def get_exact(matter_id: UUID, key: _Key) -> Optional[Tuple[str, List[dict]]]:
+    """Return cached (context_text, references) for an exact key, or None."""
+    entries = _cache.get(matter_id)
+    if not entries:
+        return None
+    entry = entries.get(key)
+    if entry is None:
+        return None
+    ts, _, context_text, references = entry
+    if time.monotonic() - ts > _TTL_SECONDS:
+        del entries[key]
+        return None
+    return context_text, references
+
+
+def get_similar(
+    matter_id: UUID, page_filter: Optional[int], query_embedding: List[float]
+) -> Optional[Tuple[str, List[dict]]]:
+    """Return the cached result whose query embedding is cosine-closest,
+    if it clears the similarity threshold and shares the page filter."""
+    entries = _cache.get(matter_id)
+    if not entries:
+        return None
+    now = time.monotonic()
+    for key in [k for k, entry in entries.items() if now - entry[0] > _TTL_SECONDS]:
+        del entries[key]
+    candidates = [entry for key, entry in entries.items() if key[1] == page_filter]
+    if not candidates:
+        return None
+    # Embeddings are stored unit-norm, so a stacked dot product is cosine.
+    matrix = np.stack([entry[1] for entry in candidates])
+    sims = matrix @ _unit(query_embedding)
+    best = int(np.argmax(sims))
+    if sims[best] < _SIMILARITY_THRESHOLD:
+        return None
+    _, _, context_text, references = candidates[best]
+    return context_text, references
+
+
+def store(
+    matter_id: UUID,
+    key: _Key,
+    query_embedding: List[float],
+    context_text: str,
+    references: List[dict],
+) -> None:
+    entries = _cache.setdefault(matter_id, OrderedDict())
+    entries[key] = (time.monotonic(), _unit(query_embedding), context_text, references)
+    while len(entries) > _MAX_PER_MATTER:
+        entries.popitem(last=False)
+
+
+def invalidate_matter(matter_id: UUID) -> None:
+    """Drop all cached retrievals for a matter (new document content)."""
+    _cache.pop(matter_id, None)
+
+
+def clear_context_cache() -> None:
+    """Drop everything — primarily for tests."""
+    _cache.clear()
@@ -0,0 +1,80 @@
+"""Bounded in-process chat history store.
+
+Replaces the old module-global ``defaultdict(list)`` that grew without
+limit: long-lived workers accumulated every message for every matter ever
+chatted on. Histories are now capped per matter (oldest messages trimmed)
+and the set of matters is LRU-evicted, so worker memory is bounded no
+matter how many matters pass through.
+
+History is intentionally ephemeral — it lives for the process and is lost
+on restart, same as before. A shared store (e.g. Redis) would additionally
+let multiple workers serve the same matter, but that is a deployment
+dependency this service doesn't carry; until it does, deployments should
+keep chat sticky per worker.
+"""
+from collections import OrderedDict, deque
+from typing import Deque, List
+from uuid import UUID
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from src.chat.schemas import ChatMessage
+
+# LRU cap on concurrently remembered matters.
+_MAX_MATTERS = 512
+# Hard cap per matter; well above the window sent to the LLM.
+_MAX_MESSAGES_PER_MATTER = 200
+# Sliding window of messages sent to the LLM (prevents context overflow).
+LLM_WINDOW_MESSAGES = 20
+
+_store: "OrderedDict[UUID, List[ChatMessage]]" = OrderedDict()
+# LangChain mirror of the LLM window, maintained incrementally on append so
+# prompt building doesn't reconvert the whole history every turn.
+_lc_store: "dict[UUID, Deque[BaseMessage]]" = {}
+
+
+def append(matter_id: UUID, message: ChatMessage) -> None:
+    """Append a message, trimming the matter and evicting cold matters."""
+    messages = _store.get(matter_id)
+    if messages is None:
+        messages = []
+        _store[matter_id] = messages
+    else:
+        _store.move_to_end(matter_id)
+    messages.append(message)
+    if len(messages) > _MAX_MESSAGES_PER_MATTER:
+        del messages[: len(messages) - _MAX_MESSAGES_PER_MATTER]
+
+    lc_messages = _lc_store.get(matter_id)
+    if lc_messages is None:
+        lc_messages = deque(maxlen=LLM_WINDOW_MESSAGES)
+        _lc_store[matter_id] = lc_messages
+    if message.role == "user":
+        lc_messages.append(HumanMessage(content=message.content))
+    else:
+        lc_messages.append(AIMessage(content=message.content))
+
+    while len(_store) > _MAX_MATTERS:
+        evicted_id, _ = _store.popitem(last=False)
+        _lc_store.pop(evicted_id, None)
+
+
+def lc_window(matter_id: UUID) -> List[BaseMessage]:
+    """Return the LangChain message window for prompt building."""
+    lc_messages = _lc_store.get(matter_id)
+    return list(lc_messages) if lc_messages else []
+
+
+def get(matter_id: UUID) -> List[ChatMessage]:
+    """Return the matter's messages (live list; treat as read-only)."""
+    messages = _store.get(matter_id)
+    if messages is None:
+        return []
+    _store.move_to_end(matter_id)
+    return messages
+
+
+def clear_history() -> None:
+    """Drop all histories — primarily for tests."""
+    _store.clear()
+    _lc_store.clear()
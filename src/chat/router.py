@@ -19,7 +19,10 @@ async def chat_with_matter(
     db: AsyncSession = Depends(get_db),
 ):
     service = ChatService(db=db)
-    result = await service.chat(matter_id, request.message)
+    result = await service.chat(
+        matter_id, request.message,
+        force_rag=request.force_rag, no_cache=request.no_cache,
+    )
     return result
 
 
@@ -31,4 +34,6 @@ async def chat_stream(
     db: AsyncSession = Depends(get_db),
 ):
     service = ChatService(db=db)
-    return EventSourceResponse(service.stream_chat(matter_id, request.message))
+    return EventSourceResponse(
+        service.stream_chat(matter_id, request.message, force_rag=request.force_rag)
+    )
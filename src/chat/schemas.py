@@ -18,6 +18,11 @@ class ChatMessage(BaseModel):
     
 class ChatRequest(BaseModel):
     message: str
+    # Manual override for the retrieval gate: always run document search
+    # even for messages that look like small talk or meta-requests.
+    force_rag: bool = False
+    # Opt out of the exact-match response cache (non-streaming chat only).
+    no_cache: bool = False
 
 class ChatResponse(BaseModel):
     response: str
@@ -1,31 +1,113 @@
-import json
+import hashlib
 import logging
 import re
+import time
 from typing import Dict, List, Any, Optional
 from uuid import UUID
-from collections import defaultdict
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from collections import OrderedDict, defaultdict
+
+import orjson
+from langchain_core.messages import SystemMessage
 
 from src.config import settings
+from src.chat import context_cache
+from src.chat import history as chat_history
 from src.chat.schemas import ChatMessage
+from src.llm.embed_batcher import embed_query
 from src.llm.factory import get_chat_llm
 from src.documents.service import DocumentService
 
 logger = logging.getLogger(__name__)
 
-# In-memory storage for chat history
-# Format: {matter_id: [ChatMessage, ...]}
-CHAT_HISTORY: Dict[UUID, List[ChatMessage]] = defaultdict(list)
-
-# Max history messages to send to LLM (prevents context overflow)
-MAX_HISTORY_MESSAGES = 20
-
 # Regex to strip DeepSeek R1 thinking tokens
 THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
 
+# Page references ("page 12") in user messages — compiled once; callers
+# guard with a substring check first since most messages never mention one.
+_PAGE_RE = re.compile(r"page\s+(\d+)", re.IGNORECASE)
+
+# Retrieval gate: messages that are pure conversation management never need
+# document context, so skipping retrieval for them removes an embedding call
+# plus a hybrid search from the critical path.
+_SMALL_TALK_RE = re.compile(
+    r"^(hi|hello|hey|yo|thanks?|thank you|thx|ok(ay)?|cool|great|nice|got it|"
+    r"good (morning|afternoon|evening)|bye|goodbye|cheers|sure|yes|no|yep|nope)"
+    r"[\s!.,]*$",
+    re.IGNORECASE,
+)
+# The object of the verb must refer to the assistant's prior output — a
+# bare "that/this/it" after the verb would also match ordinary document
+# questions ("summarize this patent brief"), which need retrieval most.
+_META_REQUEST_RE = re.compile(
+    r"\b(rephrase|reword|repeat|shorten|simplify|elaborate on|expand on|"
+    r"translate|summari[sz]e)\b[^.?!]{0,40}"
+    r"\b(your (last |previous )?(answer|response|message|reply)"
+    r"|that (answer|response))\b"
+    r"|\b(rephrase|reword|repeat|shorten|simplify|summari[sz]e) (that|it)[\s.!?]*$"
+    r"|\bsay (that|it) again\b"
+    r"|\b(put|say) (that|it) in (simpler|plain(er)?|other) (words|terms|language)\b",
+    re.IGNORECASE,
+)
+_SMALL_TALK_MAX_WORDS = 6
+
+
+def _dumps(obj) -> str:
+    """orjson-based JSON encoding for SSE frames — stream_chat serializes
+    one frame per token, so this sits on the streaming hot path."""
+    return orjson.dumps(obj).decode()
+
+
+# Constant SSE payloads, encoded once.
+_DONE_EVENT = _dumps({"status": "completed"})
+_RETRIEVAL_ERROR_EVENT = _dumps({"detail": "Document retrieval failed"})
+
+# Exact-match response cache: an identical prompt — same system content
+# including retrieved context, same history window, same question — produces
+# the same answer, so the second LLM call is pure cost. Keyed on a digest of
+# the full message list; any difference in retrieved chunks or history
+# changes the key. Streaming responses are not cached — replaying a cached
+# answer as fake token events would misrepresent the stream.
+_RESPONSE_CACHE_TTL_SECONDS = 300
+_RESPONSE_CACHE_MAX = 256
+_response_cache: "OrderedDict[bytes, tuple[float, str]]" = OrderedDict()
+
+
+def _response_cache_key(messages: List) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for msg in messages:
+        h.update(msg.type.encode("utf-8"))
+        h.update(b"\x00")
+        h.update(str(msg.content).encode("utf-8"))
+        h.update(b"\x00")
+    return h.digest()
+
+
+def _get_cached_response(key: bytes) -> Optional[str]:
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    ts, content = entry
+    if time.monotonic() - ts > _RESPONSE_CACHE_TTL_SECONDS:
+        del _response_cache[key]
+        return None
+    return content
+
+
+def _store_response(key: bytes, content: str) -> None:
+    _response_cache[key] = (time.monotonic(), content)
+    while len(_response_cache) > _RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+
+
+def clear_response_cache() -> None:
+    """Drop cached chat responses (called when LLM settings change)."""
+    _response_cache.clear()
+
 
 def _strip_thinking(text: str) -> str:
     """Remove <think>...</think> blocks from DeepSeek R1 output."""
+    if "<think>" not in text:
+        return text.strip()
     return THINK_RE.sub("", text).strip()
 
 
@@ -48,11 +130,44 @@ class ChatService:
 
     def _extract_page_number(self, message: str) -> Optional[int]:
         """Extract page number from user message if referenced."""
-        match = re.search(r'page\s+(\d+)', message, re.IGNORECASE)
+        # Cheap substring check before engaging the regex engine — the vast
+        # majority of messages don't reference a page at all.
+        if "page" not in message.lower():
+            return None
+        match = _PAGE_RE.search(message)
         return int(match.group(1)) if match else None
 
+    def _should_retrieve(self, matter_id: UUID, user_message: str) -> bool:
+        """Decide whether a message needs document retrieval at all.
+
+        Greetings/acknowledgements and meta-requests about the previous
+        answer ("rephrase that", "summarize your last response") are
+        answerable from history alone; everything else retrieves.
+        """
+        stripped = user_message.strip()
+        if not stripped:
+            return False
+        if (
+            len(stripped.split()) <= _SMALL_TALK_MAX_WORDS
+            and _SMALL_TALK_RE.match(stripped)
+        ):
+            return False
+        # Meta-requests only make sense once there is an answer to operate
+        # on; otherwise treat them as a normal question.
+        has_assistant_turn = any(
+            msg.role == "assistant" for msg in chat_history.get(matter_id)
+        )
+        if has_assistant_turn and _META_REQUEST_RE.search(stripped):
+            return False
+        return True
+
     async def _retrieve_context(self, matter_id: UUID, user_message: str):
-        """Retrieve relevant document chunks for RAG context."""
+        """Retrieve relevant document chunks for RAG context.
+
+        Results are cached per matter: an exact-match hit skips both the
+        embedding call and the hybrid search, and a near-duplicate phrasing
+        (cosine >= threshold on the query embedding) still skips the search.
+        """
         context_text = ""
         references = []
         if not self.db:
@@ -60,8 +175,20 @@ class ChatService:
 
         doc_service = DocumentService(self.db)
         page_filter = self._extract_page_number(user_message)
+
+        key = context_cache.exact_key(user_message, page_filter)
+        cached = context_cache.get_exact(matter_id, key)
+        if cached is not None:
+            return cached
+
+        query_embedding = await embed_query(user_message)
+        cached = context_cache.get_similar(matter_id, page_filter, query_embedding)
+        if cached is not None:
+            return cached
+
         chunks = await doc_service.search_chunks(
-            matter_id, user_message, top_k=8, page_filter=page_filter
+            matter_id, user_message, top_k=8, page_filter=page_filter,
+            query_embedding=query_embedding,
         )
         if chunks:
             context_parts = []
@@ -83,6 +210,7 @@ class ChatService:
                     "total_pages": chunk.get("total_pages"),
                 })
             context_text = "\n\n---\n\n".join(context_parts)
+        context_cache.store(matter_id, key, query_embedding, context_text, references)
         return context_text, references
 
     def _build_messages(
@@ -98,76 +226,98 @@ class ChatService:
                 f"{context_text}"
             )
 
-        messages = [SystemMessage(content=system_content)]
-
-        # Trim history to last N messages to prevent context overflow
-        history = list(CHAT_HISTORY[matter_id])
-        if len(history) > MAX_HISTORY_MESSAGES:
-            history = history[-MAX_HISTORY_MESSAGES:]
-
-        # Exclude the current user message (last in history) — we add it explicitly
-        for msg in history[:-1]:
-            if msg.role == "user":
-                messages.append(HumanMessage(content=msg.content))
-            elif msg.role == "assistant":
-                messages.append(AIMessage(content=msg.content))
-        messages.append(HumanMessage(content=user_message))
-        return messages
-
-    async def chat(self, matter_id: UUID, user_message: str) -> Dict[str, Any]:
-        # 1. Update History with User Message
-        CHAT_HISTORY[matter_id].append(ChatMessage(role="user", content=user_message))
-
-        # 2. Retrieve relevant document context (RAG)
-        try:
-            context_text, references = await self._retrieve_context(matter_id, user_message)
-        except Exception as e:
-            logger.error(f"RAG retrieval failed for matter {matter_id}: {e}", exc_info=True)
-            context_text, references = "", []
-
-        # 3. Build messages
-        messages = self._build_messages(matter_id, user_message, context_text)
+        # The history store maintains the windowed LangChain message list
+        # incrementally, so no per-turn reconversion of the whole history.
+        # The current user message is already the window's last entry —
+        # callers append it to history before building.
+        return [SystemMessage(content=system_content), *chat_history.lc_window(matter_id)]
+
+    async def chat(
+        self,
+        matter_id: UUID,
+        user_message: str,
+        force_rag: bool = False,
+        no_cache: bool = False,
+    ) -> Dict[str, Any]:
+        # 1. Retrieval gate — evaluated before the message joins history so
+        # the meta-request check sees the previous assistant turn as last.
+        needs_rag = force_rag or self._should_retrieve(matter_id, user_message)
+
+        # 2. Update History with User Message
+        # model_construct skips re-validation of strings we just produced;
+        # validated construction stays at the API boundary (ChatRequest).
+        chat_history.append(
+            matter_id, ChatMessage.model_construct(role="user", content=user_message)
+        )
 
-        # 4. Call LLM
-        response = await self.llm.ainvoke(messages)
-        ai_content = _strip_thinking(str(response.content))
+        # 3. Retrieve relevant document context (RAG)
+        context_text, references = "", []
+        if needs_rag:
+            try:
+                context_text, references = await self._retrieve_context(matter_id, user_message)
+            except Exception as e:
+                logger.error(f"RAG retrieval failed for matter {matter_id}: {e}", exc_info=True)
 
-        # 5. Update History with AI Response
-        ai_message = ChatMessage(
+        # 4. Build messages
+        messages = self._build_messages(matter_id, user_message, context_text)
+
+        # 5. Call LLM (unless the exact prompt was answered recently)
+        cache_key = None if no_cache else _response_cache_key(messages)
+        ai_content = _get_cached_response(cache_key) if cache_key else None
+        if ai_content is None:
+            response = await self.llm.ainvoke(messages)
+            ai_content = _strip_thinking(str(response.content))
+            if cache_key is not None:
+                _store_response(cache_key, ai_content)
+
+        # 6. Update History with AI Response
+        ai_message = ChatMessage.model_construct(
             role="assistant", content=ai_content,
             references=references if references else None,
         )
-        CHAT_HISTORY[matter_id].append(ai_message)
+        chat_history.append(matter_id, ai_message)
 
         return {
             "response": ai_content,
-            "history": CHAT_HISTORY[matter_id],
+            "history": chat_history.get(matter_id),
             "references": references if references else None,
         }
 
     async def get_history(self, matter_id: UUID) -> List[ChatMessage]:
-        return CHAT_HISTORY[matter_id]
+        return chat_history.get(matter_id)
 
-    async def stream_chat(self, matter_id: UUID, user_message: str):
-        # 1. Update History with User Message
-        CHAT_HISTORY[matter_id].append(ChatMessage(role="user", content=user_message))
+    async def stream_chat(self, matter_id: UUID, user_message: str, force_rag: bool = False):
+        # 1. Retrieval gate (see chat())
+        needs_rag = force_rag or self._should_retrieve(matter_id, user_message)
+
+        # 2. Update History with User Message
+        # model_construct skips re-validation of strings we just produced;
+        # validated construction stays at the API boundary (ChatRequest).
+        chat_history.append(
+            matter_id, ChatMessage.model_construct(role="user", content=user_message)
+        )
 
-        # 2. Retrieve relevant document context (RAG)
-        try:
-            context_text, references = await self._retrieve_context(matter_id, user_message)
-        except Exception as e:
-            logger.error(f"RAG retrieval failed for matter {matter_id}: {e}", exc_info=True)
-            context_text, references = "", []
-            yield {"event": "error", "data": json.dumps({"detail": "Document retrieval failed"})}
+        # 3. Retrieve relevant document context (RAG)
+        context_text, references = "", []
+        if needs_rag:
+            try:
+                context_text, references = await self._retrieve_context(matter_id, user_message)
+            except Exception as e:
+                logger.error(f"RAG retrieval failed for matter {matter_id}: {e}", exc_info=True)
+                yield {"event": "error", "data": _RETRIEVAL_ERROR_EVENT}
 
         if references:
-            yield {"event": "references", "data": json.dumps(references)}
+            yield {"event": "references", "data": _dumps(references)}
 
-        # 3. Build messages
+        # 4. Build messages
         messages = self._build_messages(matter_id, user_message, context_text)
 
-        # 4. Stream LLM tokens — filter out <think> blocks
-        full_response = ""
+        # 5. Stream LLM tokens — filter out <think> blocks
+        # Response text accumulates in a list (joined once at the end), and
+        # the think buffer is only ever searched from where the previous
+        # scan left off, so a long thinking block doesn't get re-scanned on
+        # every token.
+        response_parts: List[str] = []
         in_thinking = False
         think_buffer = ""
 
@@ -178,43 +328,48 @@ class ChatService:
 
             # Handle <think>...</think> filtering for DeepSeek R1
             if in_thinking:
+                # The close tag may straddle the old buffer tail and the new
+                # token, so back up by len("</think>") - 1 before searching.
+                search_from = max(0, len(think_buffer) - len("</think>") + 1)
                 think_buffer += token
-                if "</think>" in think_buffer:
+                end = think_buffer.find("</think>", search_from)
+                if end != -1:
                     # End of thinking block — discard everything and resume
-                    after = think_buffer.split("</think>", 1)[1]
+                    after = think_buffer[end + len("</think>"):]
                     in_thinking = False
                     think_buffer = ""
                     if after:
-                        full_response += after
-                        yield {"event": "message", "data": json.dumps({"content": after})}
+                        response_parts.append(after)
+                        yield {"event": "message", "data": _dumps({"content": after})}
                 continue
 
             if "<think>" in token:
                 # Start of thinking block
                 before, _, remainder = token.partition("<think>")
                 if before:
-                    full_response += before
-                    yield {"event": "message", "data": json.dumps({"content": before})}
+                    response_parts.append(before)
+                    yield {"event": "message", "data": _dumps({"content": before})}
                 in_thinking = True
                 think_buffer = remainder
                 # Check if thinking ended in the same token
-                if "</think>" in think_buffer:
-                    after = think_buffer.split("</think>", 1)[1]
+                end = think_buffer.find("</think>")
+                if end != -1:
+                    after = think_buffer[end + len("</think>"):]
                     in_thinking = False
                     think_buffer = ""
                     if after:
-                        full_response += after
-                        yield {"event": "message", "data": json.dumps({"content": after})}
+                        response_parts.append(after)
+                        yield {"event": "message", "data": _dumps({"content": after})}
                 continue
 
-            full_response += token
-            yield {"event": "message", "data": json.dumps({"content": token})}
+            response_parts.append(token)
+            yield {"event": "message", "data": _dumps({"content": token})}
 
-        # 5. Update History
-        ai_message = ChatMessage(
-            role="assistant", content=full_response,
+        # 6. Update History
+        ai_message = ChatMessage.model_construct(
+            role="assistant", content="".join(response_parts),
             references=references if references else None,
         )
-        CHAT_HISTORY[matter_id].append(ai_message)
+        chat_history.append(matter_id, ai_message)
 
-        yield {"event": "done", "data": json.dumps({"status": "completed"})}
+        yield {"event": "done", "data": _DONE_EVENT}
@@ -101,6 +101,9 @@ class Settings(BaseSettings):
     LLM_PROVIDER_SUGGESTIONS: str = "azure_foundry"
     LLM_PROVIDER_EMBEDDING: str = "azure_openai"
 
+    # Global cap on concurrently outstanding LLM calls across all agents
+    LLM_MAX_INFLIGHT: int = 32
+
     model_config = SettingsConfigDict(case_sensitive=True, env_file=".env")
 
 settings = Settings()
@@ -2,7 +2,16 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from src.config import settings
 
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=False)
+# asyncpg keeps a per-connection prepared-statement cache, so hot queries
+# (user-by-email lookup, permission join, version MAX aggregates) skip the
+# Postgres parse/plan step after first execution. Note: requires direct
+# connections or pgbouncer in session mode — transaction pooling breaks
+# prepared statements.
+engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    echo=False,
+    connect_args={"statement_cache_size": 500},
+)
 AsyncSessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -1,8 +1,8 @@
 from enum import Enum
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, Computed, String, Integer, Text, ForeignKey, Enum as SAEnum
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from src.database import Base
 from src.shared.models import AuditMixin
 
@@ -37,8 +37,12 @@ class DocumentChunk(Base, AuditMixin):
     document_id = Column(ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     page_number = Column(Integer, nullable=False)
     content = Column(Text, nullable=False)
-    embedding = Column(Vector(1536), nullable=True)  # pgvector
+    embedding = Column(HALFVEC(1536), nullable=True)  # pgvector FP16
     token_count = Column(Integer, default=0)
-    search_vector = Column(TSVECTOR, nullable=True)
+    search_vector = Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', content)", persisted=True),
+        nullable=True,
+    )
 
     document = relationship("Document", back_populates="chunks")
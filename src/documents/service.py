@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import logging
 from collections import defaultdict
@@ -8,8 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from src.chat.context_cache import invalidate_matter
 from src.documents.models import Document, DocumentChunk, DocumentStatus
 from src.ingestion.service import IngestionService
+from src.llm.embed_batcher import embed_query
 from src.llm.factory import get_embeddings
 
 logger = logging.getLogger(__name__)
@@ -67,6 +70,9 @@ class DocumentService:
             doc.status = DocumentStatus.READY
             await self.db.commit()
             await self.db.refresh(doc)
+            # New searchable content: cached chat retrievals for this matter
+            # are now stale.
+            invalidate_matter(doc.matter_id)
             logger.info(f"Document {doc.id} processed: {len(pages)} pages, {len(all_chunks)} chunks")
             return doc
 
@@ -82,25 +88,65 @@ class DocumentService:
         query: str,
         top_k: int = 5,
         page_filter: Optional[int] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[dict]:
-        """Hybrid search: semantic + full-text with RRF reranking."""
+        """Hybrid search: semantic + full-text with RRF reranking.
+
+        Callers that already embedded the query (e.g. for cache lookups) can
+        pass ``query_embedding`` to skip a second embedding round-trip.
+        """
         fetch_k = top_k * 2
 
-        # 1. Semantic search via pgvector
-        query_embedding = await self.embeddings.aembed_query(query)
+        # 1. Full-text search via tsvector. When the query still needs
+        # embedding, the FTS query (DB session) runs concurrently with the
+        # embedding call (HTTP round-trip to the provider) — they touch
+        # different resources, so the overlap hides one of the two
+        # latencies. The session itself is never used from two coroutines.
+        async def _fts_search():
+            result = await self.db.execute(
+                text("""
+                    SELECT dc.id, dc.document_id, dc.page_number, dc.content, dc.token_count,
+                           ts_rank(dc.search_vector, plainto_tsquery('english', :query)) AS fts_rank,
+                           d.filename, d.content_type, d.total_pages
+                    FROM document_chunks dc
+                    JOIN documents d ON dc.document_id = d.id
+                    WHERE d.matter_id = :matter_id
+                      AND d.status = 'READY'
+                      AND dc.search_vector @@ plainto_tsquery('english', :query)
+                    ORDER BY fts_rank DESC
+                    LIMIT :fetch_k
+                """),
+                {
+                    "query": query,
+                    "matter_id": str(matter_id),
+                    "fetch_k": fetch_k,
+                },
+            )
+            return result.fetchall()
+
+        if query_embedding is None:
+            query_embedding, fts_rows = await asyncio.gather(
+                embed_query(query), _fts_search()
+            )
+        else:
+            fts_rows = await _fts_search()
+
+        # 2. Semantic search via pgvector
+        # Tune HNSW recall/latency for this transaction only
+        await self.db.execute(text("SET LOCAL hnsw.ef_search = 40"))
         # Format as pgvector-compatible string: [0.1,0.2,...] with no spaces
         embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
         semantic_result = await self.db.execute(
             text("""
                 SELECT dc.id, dc.document_id, dc.page_number, dc.content, dc.token_count,
-                       dc.embedding <=> cast(:query_embedding as vector) AS distance,
+                       dc.embedding <=> cast(:query_embedding as halfvec) AS distance,
                        d.filename, d.content_type, d.total_pages
                 FROM document_chunks dc
                 JOIN documents d ON dc.document_id = d.id
                 WHERE d.matter_id = :matter_id
                   AND d.status = 'READY'
                   AND dc.embedding IS NOT NULL
-                ORDER BY dc.embedding <=> cast(:query_embedding as vector)
+                ORDER BY dc.embedding <=> cast(:query_embedding as halfvec)
                 LIMIT :fetch_k
             """),
             {
@@ -111,28 +157,6 @@ class DocumentService:
         )
         semantic_rows = semantic_result.fetchall()
 
-        # 2. Full-text search via tsvector
-        fts_result = await self.db.execute(
-            text("""
-                SELECT dc.id, dc.document_id, dc.page_number, dc.content, dc.token_count,
-                       ts_rank(dc.search_vector, plainto_tsquery('english', :query)) AS fts_rank,
-                       d.filename, d.content_type, d.total_pages
-                FROM document_chunks dc
-                JOIN documents d ON dc.document_id = d.id
-                WHERE d.matter_id = :matter_id
-                  AND d.status = 'READY'
-                  AND dc.search_vector @@ plainto_tsquery('english', :query)
-                ORDER BY fts_rank DESC
-                LIMIT :fetch_k
-            """),
-            {
-                "query": query,
-                "matter_id": str(matter_id),
-                "fetch_k": fetch_k,
-            },
-        )
-        fts_rows = fts_result.fetchall()
-
         # 3. Merge with Reciprocal Rank Fusion
         merged = self._rrf_merge(semantic_rows, fts_rows, top_k=top_k, page_filter=page_filter)
 
@@ -180,15 +204,29 @@ class DocumentService:
         return [metadata[chunk_id] for chunk_id, _ in ranked]
 
     @staticmethod
-    def format_chunks_as_context(chunks: List[dict]) -> str:
-        """Format search result chunks into a context string for agent prompts."""
+    def format_chunks_as_context(chunks: List[dict], max_tokens: int = 2000) -> str:
+        """Format search result chunks into a context string for agent prompts.
+
+        Chunks arrive rank-ordered from hybrid search, so formatting stops
+        once the running token count would exceed ``max_tokens`` — the
+        highest-ranked chunk is always included, but oversized documents
+        can't dominate the prompt (and its cost/TTFT) with low-ranked tail
+        context.
+        """
         if not chunks:
             return ""
         parts = []
+        budget = max_tokens
         for chunk in chunks:
             filename = chunk.get("filename", "unknown")
             page = chunk.get("page_number", "?")
             content = chunk.get("content", "")
+            # token_count is stored at ingestion; fall back to a chars/4
+            # estimate for chunks predating it.
+            tokens = chunk.get("token_count") or len(content) // 4
+            if parts and tokens > budget:
+                break
+            budget -= tokens
             parts.append(f"[{filename}, Page {page}]: {content}")
         return "\n\n---\n\n".join(parts)
 
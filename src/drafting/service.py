@@ -134,6 +134,7 @@ class DraftingService:
             "messages": [],
             "errors": [],
             "canonical_model": None,
+            "canonical_model_json": None,
             "system_claim_nodes": None,
             "method_claim_nodes": None,
             "medium_claim_nodes": None,
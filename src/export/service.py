@@ -14,6 +14,7 @@ from src.artifacts.briefs.models import BriefVersion
 from src.artifacts.claims.models import ClaimGraphVersion
 from src.artifacts.specs.models import SpecVersion
 from src.audit.models import AuditEvent, AuditEventType
+from src.audit.recorder import record_audit_event
 from src.matter.models import Matter, MatterState
 from src.matter.services import MatterService
 
@@ -92,15 +93,14 @@ class ExportService:
         buffer.seek(0)
         docx_bytes = buffer.read()
 
-        # Log audit event
-        event = AuditEvent(
+        # Audit-only write — queue it off the response path; the download
+        # shouldn't wait on a commit that carries no other state.
+        record_audit_event(
             matter_id=matter_id,
             event_type=AuditEventType.EXPORT_GENERATED,
             actor_id=actor_id,
             detail={"format": "docx", "size_bytes": len(docx_bytes)},
         )
-        self.db.add(event)
-        await self.db.commit()
 
         return docx_bytes
 
@@ -209,15 +209,14 @@ class ExportService:
 
         pdf_bytes = pdf.output()
 
-        # Audit event
-        event = AuditEvent(
+        # Audit-only write — queue it off the response path; the download
+        # shouldn't wait on a commit that carries no other state.
+        record_audit_event(
             matter_id=matter_id,
             event_type=AuditEventType.EXPORT_GENERATED,
             actor_id=actor_id,
             detail={"format": "pdf", "size_bytes": len(pdf_bytes)},
         )
-        self.db.add(event)
-        await self.db.commit()
 
         return pdf_bytes
 
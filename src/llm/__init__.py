@@ -5,6 +5,7 @@ from src.llm.factory import (
     get_vision_llm,
     get_suggestions_llm,
     get_embeddings,
+    get_llm_semaphore,
     clear_llm_cache,
     load_config_overrides,
 )
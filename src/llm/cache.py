@@ -0,0 +1,50 @@
+"""In-process response cache for structured LLM calls.
+
+Iterative drafting re-runs agents on unchanged inputs constantly; caching the
+structured result keyed on a digest of the prompt inputs turns those repeat
+multi-second LLM calls into sub-millisecond lookups. Entries store the result
+as JSON and hits revalidate cheaply via ``model_validate_json`` — the same
+exact-match pattern the claims pipeline uses internally.
+"""
+
+import hashlib
+import time
+from typing import Awaitable, Callable, Dict, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+_CACHE: Dict[str, Tuple[float, str]] = {}
+_CACHE_MAX = 1024
+_TTL_SECONDS = 24 * 60 * 60
+
+
+def digest(*parts: str) -> str:
+    """Composite SHA-256 over the given prompt inputs."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"|")
+    return h.hexdigest()
+
+
+async def get_or_compute(
+    key: str, model_cls: Type[T], fn: Callable[[], Awaitable[T]]
+) -> T:
+    """Return the cached result for ``key`` or compute and cache it."""
+    now = time.monotonic()
+    entry = _CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        return model_cls.model_validate_json(entry[1])
+
+    result = await fn()
+    if len(_CACHE) >= _CACHE_MAX:
+        _CACHE.pop(next(iter(_CACHE)))
+    _CACHE[key] = (now + _TTL_SECONDS, result.model_dump_json())
+    return result
+
+
+def clear_response_cache() -> None:
+    """Drop all cached responses (used by tests and settings changes)."""
+    _CACHE.clear()
@@ -0,0 +1,71 @@
+"""Micro-batching coalescer for query embeddings.
+
+Under concurrent load, N simultaneous searches each pay their own embedding
+round-trip. The provider's batch endpoint embeds many texts in one call for
+roughly the cost of one, so callers here enqueue their text and await a
+future; a single worker coroutine drains whatever arrives within a short
+window into one ``aembed_documents`` call and resolves the futures by index.
+
+A lone caller only waits out the (15ms) window when a second request is
+actually in flight — the first queue item is consumed immediately.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from src.llm.factory import get_embeddings
+
+logger = logging.getLogger(__name__)
+
+_MAX_BATCH = 32
+_BATCH_WINDOW_SECONDS = 0.015
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+
+async def embed_query(text: str) -> List[float]:
+    """Embed one query, coalescing with concurrent callers into one API call.
+
+    The worker is started lazily on the running loop the first time this is
+    called, mirroring the audit recorder.
+    """
+    global _queue, _worker
+    if _queue is None:
+        _queue = asyncio.Queue()
+    if _worker is None or _worker.done():
+        _worker = asyncio.get_running_loop().create_task(_drain())
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _queue.put_nowait((text, future))
+    return await future
+
+
+async def _drain() -> None:
+    while True:
+        batch: List[Tuple[str, asyncio.Future]] = [await _queue.get()]
+        # Collect whatever else arrives within the window so a burst becomes
+        # one batched embedding call instead of N single-text ones.
+        try:
+            while len(batch) < _MAX_BATCH:
+                batch.append(
+                    await asyncio.wait_for(_queue.get(), timeout=_BATCH_WINDOW_SECONDS)
+                )
+        except asyncio.TimeoutError:
+            pass
+
+        texts = [text for text, _ in batch]
+        try:
+            vectors = await get_embeddings().aembed_documents(texts)
+        except Exception as e:
+            # Propagate the failure to every waiting caller; the worker
+            # itself stays alive for the next batch.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            logger.exception("Batch embedding of %d text(s) failed", len(texts))
+            continue
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
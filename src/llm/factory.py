@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from src.config import settings
@@ -17,16 +18,85 @@ _llm_cache: dict[str, BaseChatModel] = {}
 _embedding_cache: dict[str, Embeddings] = {}
 _config_overrides: dict[str, str] = {}
 
+# Shared in-flight limiter so burst load across all agents stays within the
+# provider's rate limits instead of failing pipelines on 429s. Created
+# lazily so the semaphore is bound inside the running event loop.
+_llm_semaphore: asyncio.Semaphore | None = None
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the process-wide semaphore bounding concurrent LLM calls."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(settings.LLM_MAX_INFLIGHT)
+    return _llm_semaphore
+
+
+# Shared async HTTP client so every OpenAI-family model instance reuses one
+# connection pool (and its keep-alive TCP/TLS sessions) instead of each
+# wrapping its own. Lives for the process lifetime; created lazily like the
+# provider imports.
+_http_async_client = None
+
+
+def _get_http_async_client():
+    global _http_async_client
+    if _http_async_client is None:
+        import httpx
+
+        _http_async_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            # Generous read timeout for long generations, but fail fast on
+            # connect so a dead endpoint doesn't hold requests for minutes.
+            timeout=httpx.Timeout(120.0, connect=5.0),
+        )
+    return _http_async_client
+
+
+async def close_http_async_client() -> None:
+    """Close the shared HTTP client's pool. Called from app shutdown."""
+    global _http_async_client
+    if _http_async_client is not None:
+        await _http_async_client.aclose()
+        _http_async_client = None
+
+
+def cacheable_system_message(text: str, llm: BaseChatModel):
+    """Return a system message template entry for ``text``.
+
+    On Anthropic models the content is emitted as a block tagged with an
+    ephemeral cache_control breakpoint, so the static system prompt hits the
+    provider's prompt cache on repeated calls instead of being re-billed and
+    re-processed each time. Other providers get the plain string form.
+    """
+    if type(llm).__name__ == "ChatAnthropic":
+        return (
+            "system",
+            [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}],
+        )
+    return ("system", text)
+
 
 # ---------------------------------------------------------------------------
 # Override management (called by LLMSettingsService)
 # ---------------------------------------------------------------------------
 
 def load_config_overrides(overrides: dict[str, str]) -> None:
-    """Replace the in-memory config overrides and clear all cached instances."""
+    """Replace the in-memory config overrides and clear all cached state."""
     _config_overrides.clear()
     _config_overrides.update(overrides)
     clear_llm_cache()
+    # Cached responses were produced by the previous model configuration and
+    # their keys carry no model identity, so they must be dropped alongside
+    # the instances. Imported lazily to avoid import cycles (those modules
+    # import this factory).
+    from src.llm.cache import clear_response_cache
+    from src.agents.claims.nodes import clear_response_cache as clear_claims_responses
+    from src.chat.service import clear_response_cache as clear_chat_responses
+
+    clear_response_cache()
+    clear_claims_responses()
+    clear_chat_responses()
 
 
 def clear_llm_cache() -> None:
@@ -76,6 +146,7 @@ def _create_chat_model(
             model=openai_model,
             temperature=temperature,
             api_key=_config_overrides.get("openai_api_key") or settings.OPENAI_API_KEY,
+            http_async_client=_get_http_async_client(),
         )
         if json_mode:
             kwargs["model_kwargs"] = {"response_format": {"type": "json_object"}}
@@ -96,6 +167,7 @@ def _create_chat_model(
             api_key=api_key,
             api_version=settings.AZURE_OPENAI_API_VERSION,
             temperature=temperature,
+            http_async_client=_get_http_async_client(),
         )
         if json_mode:
             kwargs["model_kwargs"] = {"response_format": {"type": "json_object"}}
@@ -147,6 +219,7 @@ def _create_embeddings(provider: str) -> Embeddings:
         return OpenAIEmbeddings(
             model=model,
             api_key=_config_overrides.get("openai_api_key") or settings.OPENAI_API_KEY,
+            http_async_client=_get_http_async_client(),
         )
 
     if provider == "azure_openai":
@@ -164,6 +237,7 @@ def _create_embeddings(provider: str) -> Embeddings:
             azure_endpoint=endpoint,
             api_key=api_key,
             api_version=settings.AZURE_OPENAI_API_VERSION,
+            http_async_client=_get_http_async_client(),
         )
 
     if provider in ("anthropic", "azure_foundry"):
@@ -179,9 +253,10 @@ def _create_embeddings(provider: str) -> Embeddings:
 def get_primary_llm() -> BaseChatModel:
     """Primary Reasoning Engine. Used for: Claims, Risk, Spec, QA, Intent."""
     key = "primary"
-    if key not in _llm_cache:
+    llm = _llm_cache.get(key)
+    if llm is None:
         provider = _get("provider_primary", settings.LLM_PROVIDER_PRIMARY)
-        _llm_cache[key] = _create_chat_model(
+        llm = _create_chat_model(
             provider,
             ollama_model=_get("model_primary", settings.OLLAMA_MODEL_PRIMARY),
             openai_model=_get("model_primary", settings.OPENAI_MODEL_PRIMARY),
@@ -191,15 +266,17 @@ def get_primary_llm() -> BaseChatModel:
             temperature=0.1,
             json_mode=True,
         )
-    return _llm_cache[key]
+        _llm_cache[key] = llm
+    return llm
 
 
 def get_chat_llm() -> BaseChatModel:
     """Chat Engine. Used for: Conversational Chat stream."""
     key = "chat"
-    if key not in _llm_cache:
+    llm = _llm_cache.get(key)
+    if llm is None:
         provider = _get("provider_chat", settings.LLM_PROVIDER_CHAT)
-        _llm_cache[key] = _create_chat_model(
+        llm = _create_chat_model(
             provider,
             ollama_model=_get("model_chat", settings.OLLAMA_MODEL_CHAT),
             openai_model=_get("model_chat", settings.OPENAI_MODEL_CHAT),
@@ -208,15 +285,17 @@ def get_chat_llm() -> BaseChatModel:
             azure_foundry_model=_get("model_chat", settings.AZURE_FOUNDRY_MODEL_CHAT),
             temperature=0.4,
         )
-    return _llm_cache[key]
+        _llm_cache[key] = llm
+    return llm
 
 
 def get_secondary_llm() -> BaseChatModel:
     """Secondary/Fallback Engine. Used for: Retries, rewrites, fast edits."""
     key = "secondary"
-    if key not in _llm_cache:
+    llm = _llm_cache.get(key)
+    if llm is None:
         provider = _get("provider_secondary", settings.LLM_PROVIDER_SECONDARY)
-        _llm_cache[key] = _create_chat_model(
+        llm = _create_chat_model(
             provider,
             ollama_model=_get("model_secondary", settings.OLLAMA_MODEL_SECONDARY),
             openai_model=_get("model_secondary", settings.OPENAI_MODEL_SECONDARY),
@@ -225,15 +304,17 @@ def get_secondary_llm() -> BaseChatModel:
             azure_foundry_model=_get("model_secondary", settings.AZURE_FOUNDRY_MODEL_SECONDARY),
             temperature=0.2,
         )
-    return _llm_cache[key]
+        _llm_cache[key] = llm
+    return llm
 
 
 def get_vision_llm() -> BaseChatModel:
     """Vision Engine. Used for: Parsing diagrams, charts, flowcharts in briefs."""
     key = "vision"
-    if key not in _llm_cache:
+    llm = _llm_cache.get(key)
+    if llm is None:
         provider = _get("provider_vision", settings.LLM_PROVIDER_VISION)
-        _llm_cache[key] = _create_chat_model(
+        llm = _create_chat_model(
             provider,
             ollama_model=_get("model_vision", settings.OLLAMA_MODEL_VISION),
             openai_model=_get("model_vision", settings.OPENAI_MODEL_VISION),
@@ -242,15 +323,17 @@ def get_vision_llm() -> BaseChatModel:
             azure_foundry_model=_get("model_vision", settings.AZURE_FOUNDRY_MODEL_VISION),
             temperature=0.0,
         )
-    return _llm_cache[key]
+        _llm_cache[key] = llm
+    return llm
 
 
 def get_suggestions_llm() -> BaseChatModel:
     """Suggestions Engine. Used for: Generating contextual suggested actions."""
     key = "suggestions"
-    if key not in _llm_cache:
+    llm = _llm_cache.get(key)
+    if llm is None:
         provider = _get("provider_suggestions", settings.LLM_PROVIDER_SUGGESTIONS)
-        _llm_cache[key] = _create_chat_model(
+        llm = _create_chat_model(
             provider,
             ollama_model=_get("model_suggestions", settings.OLLAMA_MODEL_SUGGESTIONS),
             openai_model=_get("model_suggestions", settings.OPENAI_MODEL_SUGGESTIONS),
@@ -260,13 +343,16 @@ def get_suggestions_llm() -> BaseChatModel:
             temperature=0.3,
             json_mode=True,
         )
-    return _llm_cache[key]
+        _llm_cache[key] = llm
+    return llm
 
 
 def get_embeddings() -> Embeddings:
     """Embedding Engine. Used for: RAG, Case Law, Prior Art."""
     key = "embedding"
-    if key not in _embedding_cache:
+    embeddings = _embedding_cache.get(key)
+    if embeddings is None:
         provider = _get("provider_embedding", settings.LLM_PROVIDER_EMBEDDING)
-        _embedding_cache[key] = _create_embeddings(provider)
-    return _embedding_cache[key]
+        embeddings = _create_embeddings(provider)
+        _embedding_cache[key] = embeddings
+    return embeddings
@@ -1,7 +1,49 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.config import settings
 
+logger = logging.getLogger(__name__)
+
+# How often the invitation sweep runs. Expiry is still enforced on the
+# validation path; the sweep only keeps the stored status in line.
+INVITATION_SWEEP_INTERVAL_SECONDS = 3600
+
+
+async def _invitation_sweep_loop() -> None:
+    from src.auth.service import AuthService
+    from src.database import AsyncSessionLocal
+
+    while True:
+        await asyncio.sleep(INVITATION_SWEEP_INTERVAL_SECONDS)
+        try:
+            async with AsyncSessionLocal() as session:
+                expired = await AuthService(session).expire_stale_invitations()
+            if expired:
+                logger.info(f"Invitation sweep expired {expired} stale invitation(s)")
+        except Exception as e:
+            # Keep sweeping — a transient DB error shouldn't kill the loop.
+            logger.warning(f"Invitation sweep failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweep_task = asyncio.create_task(_invitation_sweep_loop())
+    yield
+    sweep_task.cancel()
+    try:
+        await sweep_task
+    except asyncio.CancelledError:
+        pass
+    # Drain the shared LLM/embedding HTTP connection pool on shutdown.
+    from src.llm.factory import close_http_async_client
+
+    await close_http_async_client()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title=settings.PROJECT_NAME,
@@ -9,6 +51,7 @@ def create_app() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
+        lifespan=lifespan,
     )
 
     # CORS — must be added before routers
@@ -1,13 +1,16 @@
 from sqlalchemy import Column, String, ForeignKey, Integer, Boolean
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from src.database import Base
-from src.shared.models import AuditMixin
+from src.shared.models import AuditMixin, uuid7
 
 
 class QAReportVersion(Base, AuditMixin):
     __tablename__ = "qa_report_versions"
 
+    # Time-ordered v7 ids keep the append-only PK index right-growing
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+
     matter_id = Column(ForeignKey("matters.id"), nullable=False, index=True)
     version_number = Column(Integer, nullable=False)
     description = Column(String, nullable=True)
@@ -250,9 +250,27 @@ class RiskService:
         # 1. Fetch claims, spec, and previous findings
         claim_text, resolved_claim_version_id = await self._get_claims_text(matter_id)
         spec_text, resolved_spec_version_id = await self._get_spec_text(matter_id, spec_version_id)
+        # 1b. Short-circuit: if an existing version already analyzed this exact
+        # claim/spec pair, the inputs are unchanged and the agent would only
+        # reproduce the same analysis — reuse it instead of firing the
+        # seven-category fan-out and minting a duplicate version.
+        existing_stmt = (
+            select(RiskAnalysisVersion)
+            .where(
+                RiskAnalysisVersion.matter_id == matter_id,
+                RiskAnalysisVersion.claim_version_id == resolved_claim_version_id,
+                RiskAnalysisVersion.spec_version_id == resolved_spec_version_id,
+            )
+            .order_by(desc(RiskAnalysisVersion.version_number))
+            .limit(1)
+        )
+        existing = (await self.db.execute(existing_stmt)).scalar_one_or_none()
+        if existing is not None:
+            return RiskAnalysis.model_validate(existing.analysis_data)
+
         previous_risk_findings = await self._get_previous_risk_findings(matter_id)
 
-        # 1b. Retrieve document context via RAG
+        # 1c. Retrieve document context via RAG
         document_context = await self._retrieve_document_context(
             matter_id, claim_text[:300] + " specification structural support"
         )
@@ -266,6 +284,7 @@ class RiskService:
             "risk_analysis": None,
             "messages": [],
             "errors": [],
+            "category_results": [],
         }
 
         final_state = await risk_re_evaluation_agent.ainvoke(initial_state)
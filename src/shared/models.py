@@ -1,9 +1,31 @@
+import os
+import time
 import uuid
 from datetime import datetime
 from sqlalchemy import Column, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from src.database import Base
 
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (48-bit ms timestamp prefix + random tail).
+
+    Inserts with v7 ids land on the right edge of the PK btree instead of a
+    random leaf, which matters for append-only tables like the audit log.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = os.urandom(10)
+    raw = ts_ms.to_bytes(6, "big") + rand
+    raw = bytes([
+        *raw[:6],
+        (raw[6] & 0x0F) | 0x70,  # version 7
+        raw[7],
+        (raw[8] & 0x3F) | 0x80,  # RFC 4122 variant
+        *raw[9:],
+    ])
+    return uuid.UUID(bytes=raw)
+
+
 class UUIDMixin:
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -9,6 +9,8 @@ from src.database import get_db
 from src.auth.models import User
 from src.auth.dependencies import require_tenant_matter
 from src.specs.schemas import SpecDocument, SpecVersionResponse, EditSpecParagraphRequest, AddSpecParagraphRequest
+from src.risk.schemas import RiskAnalysis
+from src.qa.schemas import QAReport
 from src.matter.models import Matter, MatterState
 from src.artifacts.specs.models import SpecVersion
 from src.specs.service import SpecificationService
@@ -21,6 +23,15 @@ class GenerateSpecRequest(BaseModel):
     risk_version_id: Optional[UUID] = None
 
 
+class DraftingPipelineResponse(BaseModel):
+    spec_document: SpecDocument
+    risk_analysis: RiskAnalysis
+    qa_report: QAReport
+    spec_version_id: UUID
+    risk_version_id: UUID
+    qa_version_id: UUID
+
+
 @router.post("/{matter_id}/specifications/generate", response_model=SpecDocument)
 async def generate_specification_endpoint(
     matter_id: UUID,
@@ -40,6 +51,30 @@ async def generate_specification_endpoint(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(
+    "/{matter_id}/specifications/generate-with-analyses",
+    response_model=DraftingPipelineResponse,
+)
+async def generate_specification_with_analyses_endpoint(
+    matter_id: UUID,
+    request: GenerateSpecRequest,
+    current_user: User = Depends(require_tenant_matter),
+    db: AsyncSession = Depends(get_db),
+):
+    """Generate a spec, then run risk re-evaluation and QA concurrently
+    against it via the drafting pipeline, persisting all three proposals."""
+    service = SpecificationService(db)
+    try:
+        result = await service.generate_with_analyses(
+            matter_id, request.claim_version_id, request.risk_version_id
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{matter_id}/specifications/{version_id}/commit", response_model=SpecVersionResponse)
 async def commit_spec_version_endpoint(
     matter_id: UUID,
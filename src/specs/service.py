@@ -11,9 +11,13 @@ from src.artifacts.briefs.models import BriefVersion
 from src.artifacts.claims.models import ClaimGraphVersion
 from src.audit.models import AuditEvent, AuditEventType
 from src.risk.models import RiskAnalysisVersion
+from src.risk.schemas import RiskAnalysis
+from src.qa.models import QAReportVersion
+from src.qa.schemas import QAReport
 from src.matter.models import Matter, MatterState
 from src.workstreams.models import Workstream, WorkstreamTypeEnum
 from src.agents.spec.agent import spec_agent, SpecAgentState
+from src.agents.pipeline.graph import drafting_pipeline
 from src.documents.service import DocumentService
 
 logger = logging.getLogger(__name__)
@@ -297,6 +301,145 @@ class SpecificationService:
 
         return spec_document
 
+    async def _next_version_number(self, model, matter_id: UUID) -> int:
+        stmt = (
+            select(model)
+            .where(model.matter_id == matter_id)
+            .order_by(desc(model.version_number))
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        latest = result.scalar_one_or_none()
+        return (latest.version_number + 1) if latest else 1
+
+    async def generate_with_analyses(
+        self,
+        matter_id: UUID,
+        claim_version_id: Optional[UUID] = None,
+        risk_version_id: Optional[UUID] = None,
+    ) -> Dict[str, Any]:
+        """
+        Runs the combined drafting pipeline: spec generation followed by
+        risk re-evaluation and QA validation executing concurrently against
+        the fresh spec. Persists all three artifacts as non-authoritative
+        proposals in a single transaction.
+
+        Compared to calling the three generate endpoints back-to-back, the
+        two downstream analyses overlap, so the run costs the slower of the
+        two instead of their sum.
+        """
+        # 1. Fetch inputs (same as generate_specification)
+        brief_text = await self._get_brief_text(matter_id)
+        claim_text, resolved_claim_version_id = await self._get_claims_text(
+            matter_id, claim_version_id
+        )
+        risk_findings, resolved_risk_version_id = await self._get_risk_findings(
+            matter_id, risk_version_id
+        )
+        document_context = await self._retrieve_document_context(
+            matter_id, brief_text[:300] + " " + claim_text[:200]
+        )
+
+        # 2. Run the pipeline
+        final_state = await drafting_pipeline.ainvoke({
+            "brief_text": brief_text,
+            "claim_text": claim_text,
+            "risk_findings": risk_findings,
+            "document_context": document_context,
+            "spec_document": None,
+            "spec_text": None,
+            "risk_analysis": None,
+            "qa_report": None,
+            "errors": [],
+        })
+
+        if final_state.get("errors"):
+            raise ValueError(f"Drafting pipeline failed: {final_state['errors']}")
+
+        spec_document: SpecDocument = final_state["spec_document"]
+        risk_analysis: RiskAnalysis = final_state["risk_analysis"]
+        qa_report: QAReport = final_state["qa_report"]
+
+        # 3. Persist spec proposal first — the analyses reference its id
+        spec_proposal = SpecVersion(
+            matter_id=matter_id,
+            version_number=await self._next_version_number(SpecVersion, matter_id),
+            description="AI Generated Specification",
+            content_data=spec_document.model_dump(),
+            is_authoritative=False,
+            claim_version_id=resolved_claim_version_id,
+            risk_version_id=resolved_risk_version_id,
+        )
+        self.db.add(spec_proposal)
+        await self.db.flush()
+
+        # 4. Persist risk re-evaluation against the new spec
+        risk_proposal = RiskAnalysisVersion(
+            matter_id=matter_id,
+            version_number=await self._next_version_number(RiskAnalysisVersion, matter_id),
+            description="AI Generated Risk Re-Evaluation (Post-Specification)",
+            analysis_data=risk_analysis.model_dump(),
+            is_authoritative=False,
+            claim_version_id=resolved_claim_version_id,
+            spec_version_id=spec_proposal.id,
+        )
+        self.db.add(risk_proposal)
+
+        # 5. Persist QA report against the new spec
+        qa_proposal = QAReportVersion(
+            matter_id=matter_id,
+            version_number=await self._next_version_number(QAReportVersion, matter_id),
+            description="AI Generated QA Validation",
+            report_data=qa_report.model_dump(),
+            is_authoritative=False,
+            claim_version_id=resolved_claim_version_id,
+            spec_version_id=spec_proposal.id,
+        )
+        self.db.add(qa_proposal)
+        await self.db.flush()
+
+        # 6. Update matter score and workstream pointers
+        matter = await self.db.get(Matter, matter_id)
+        if matter:
+            matter.defensibility_score = risk_analysis.defensibility_score
+
+        ws_result = await self.db.execute(
+            select(Workstream).where(
+                Workstream.matter_id == matter_id,
+                Workstream.workstream_type == WorkstreamTypeEnum.DRAFTING_APPLICATION,
+            ).limit(1)
+        )
+        workstream = ws_result.scalar_one_or_none()
+        if workstream:
+            workstream.active_spec_version_id = spec_proposal.id
+            workstream.active_risk_version_id = risk_proposal.id
+            workstream.active_qa_version_id = qa_proposal.id
+
+        # Audit events
+        for event_type, proposal, artifact_type in (
+            (AuditEventType.SPEC_GENERATED, spec_proposal, "spec"),
+            (AuditEventType.RISK_RE_EVALUATED, risk_proposal, "risk"),
+            (AuditEventType.QA_VALIDATED, qa_proposal, "qa"),
+        ):
+            self.db.add(AuditEvent(
+                matter_id=matter_id,
+                event_type=event_type,
+                actor_id=None,
+                artifact_version_id=proposal.id,
+                artifact_type=artifact_type,
+            ))
+
+        await self.db.commit()
+
+        return {
+            "spec_document": spec_document,
+            "risk_analysis": risk_analysis,
+            "qa_report": qa_report,
+            "spec_version_id": spec_proposal.id,
+            "risk_version_id": risk_proposal.id,
+            "qa_version_id": qa_proposal.id,
+        }
+
     async def commit_version(self, matter_id: UUID, version_id: UUID) -> SpecVersion:
         """
         Promotes a specific spec version to authoritative
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.artifacts.briefs.models import BriefVersion
 from src.artifacts.claims.models import ClaimGraphVersion
 from src.artifacts.specs.models import SpecVersion
-from src.chat.service import CHAT_HISTORY
+from src.chat import history as chat_history
 from src.documents.models import Document
 from src.llm.factory import get_suggestions_llm
 from src.matter.models import Matter
@@ -125,8 +125,8 @@ class SuggestionsService:
         doc_count = doc_count_result.scalar() or 0
 
         # Recent chat history
-        chat_history = CHAT_HISTORY.get(matter_id, [])
-        recent_messages = chat_history[-5:] if chat_history else []
+        matter_history = chat_history.get(matter_id)
+        recent_messages = matter_history[-5:] if matter_history else []
 
         # Extract brief summary
         brief_summary = None
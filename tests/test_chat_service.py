@@ -0,0 +1,215 @@
+"""Tests for the chat retrieval gate, history store, and stream filtering."""
+import orjson
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+
+from src.chat import history
+from src.chat.schemas import ChatMessage
+from src.chat.service import ChatService, _strip_thinking
+
+
+@pytest.fixture
+def chat_service():
+    with patch("src.chat.service.get_chat_llm"):
+        yield ChatService()
+
+
+@pytest.fixture(autouse=True)
+def clean_history():
+    history.clear_history()
+    yield
+    history.clear_history()
+
+
+# ---------------------------------------------------------------------------
+# Retrieval gate (_should_retrieve)
+# ---------------------------------------------------------------------------
+
+class TestShouldRetrieve:
+    def _with_assistant_turn(self, matter_id):
+        history.append(matter_id, ChatMessage(role="user", content="q"))
+        history.append(matter_id, ChatMessage(role="assistant", content="a"))
+
+    def test_greetings_skip_retrieval(self, chat_service):
+        matter_id = uuid4()
+        for message in ["hi", "Hello!", "thanks", "Thank you.", "ok", "bye"]:
+            assert chat_service._should_retrieve(matter_id, message) is False
+
+    def test_empty_message_skips_retrieval(self, chat_service):
+        assert chat_service._should_retrieve(uuid4(), "   ") is False
+
+    def test_document_questions_always_retrieve(self, chat_service):
+        matter_id = uuid4()
+        self._with_assistant_turn(matter_id)
+        for message in [
+            "What does claim 3 cover?",
+            "summarize this document",
+            "Can you summarize the claims in this patent brief?",
+            "translate this paragraph from the spec into plain English",
+            "expand on the risk analysis in this matter",
+            "repeat the hashing steps described on page 4",
+        ]:
+            assert chat_service._should_retrieve(matter_id, message) is True, message
+
+    def test_meta_requests_skip_retrieval_after_assistant_turn(self, chat_service):
+        matter_id = uuid4()
+        self._with_assistant_turn(matter_id)
+        for message in [
+            "rephrase that",
+            "Can you rephrase that?",
+            "summarize your last answer",
+            "shorten your previous response",
+            "say that again",
+            "put it in simpler terms",
+            "expand on that answer",
+        ]:
+            assert chat_service._should_retrieve(matter_id, message) is False, message
+
+    def test_meta_request_without_assistant_turn_retrieves(self, chat_service):
+        # Nothing to rephrase yet — treat it as a normal question.
+        assert chat_service._should_retrieve(uuid4(), "summarize your last answer") is True
+
+    def test_long_message_starting_with_greeting_retrieves(self, chat_service):
+        message = "hi, can you explain how the encryption component works?"
+        assert chat_service._should_retrieve(uuid4(), message) is True
+
+
+# ---------------------------------------------------------------------------
+# Page-number extraction
+# ---------------------------------------------------------------------------
+
+class TestExtractPageNumber:
+    def test_extracts_page_reference(self, chat_service):
+        assert chat_service._extract_page_number("see PAGE 12 please") == 12
+
+    def test_no_page_reference(self, chat_service):
+        assert chat_service._extract_page_number("what is claim 3") is None
+
+    def test_page_without_number(self, chat_service):
+        assert chat_service._extract_page_number("on the page") is None
+
+
+# ---------------------------------------------------------------------------
+# Bounded history store
+# ---------------------------------------------------------------------------
+
+class TestHistoryStore:
+    def _msg(self, i, role="user"):
+        return ChatMessage(role=role, content=f"message {i}")
+
+    def test_get_unknown_matter_returns_empty(self):
+        assert history.get(uuid4()) == []
+
+    def test_per_matter_history_is_trimmed(self):
+        matter_id = uuid4()
+        total = history._MAX_MESSAGES_PER_MATTER + 10
+        for i in range(total):
+            history.append(matter_id, self._msg(i))
+        messages = history.get(matter_id)
+        assert len(messages) == history._MAX_MESSAGES_PER_MATTER
+        # Oldest messages were dropped, newest kept.
+        assert messages[0].content == "message 10"
+        assert messages[-1].content == f"message {total - 1}"
+
+    def test_cold_matters_are_lru_evicted(self):
+        matter_ids = [uuid4() for _ in range(history._MAX_MATTERS + 1)]
+        for matter_id in matter_ids:
+            history.append(matter_id, self._msg(0))
+        assert history.get(matter_ids[0]) == []
+        assert len(history.get(matter_ids[-1])) == 1
+
+    def test_get_touches_matter_in_lru_order(self):
+        first = uuid4()
+        history.append(first, self._msg(0))
+        for _ in range(history._MAX_MATTERS - 1):
+            history.append(uuid4(), self._msg(0))
+        # Reading `first` makes it most-recently-used, so the next new
+        # matter evicts someone else.
+        history.get(first)
+        history.append(uuid4(), self._msg(0))
+        assert len(history.get(first)) == 1
+
+    def test_lc_window_mirrors_recent_messages(self):
+        matter_id = uuid4()
+        total = history.LLM_WINDOW_MESSAGES + 5
+        for i in range(total):
+            role = "user" if i % 2 == 0 else "assistant"
+            history.append(matter_id, self._msg(i, role=role))
+        window = history.lc_window(matter_id)
+        assert len(window) == history.LLM_WINDOW_MESSAGES
+        assert window[-1].content == f"message {total - 1}"
+        assert window[0].content == "message 5"
+
+    def test_lc_window_evicted_with_matter(self):
+        matter_id = uuid4()
+        history.append(matter_id, self._msg(0))
+        for _ in range(history._MAX_MATTERS):
+            history.append(uuid4(), self._msg(0))
+        assert history.lc_window(matter_id) == []
+
+
+# ---------------------------------------------------------------------------
+# <think> filtering (non-streaming strip and incremental stream scanner)
+# ---------------------------------------------------------------------------
+
+class _Chunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeStreamingLLM:
+    def __init__(self, tokens):
+        self._tokens = tokens
+
+    async def astream(self, messages):
+        for token in self._tokens:
+            yield _Chunk(token)
+
+
+class TestThinkFiltering:
+    def test_strip_thinking_removes_block(self):
+        text = "<think>step 1\nstep 2</think>The answer is 42."
+        assert _strip_thinking(text) == "The answer is 42."
+
+    def test_strip_thinking_plain_text_unchanged(self):
+        assert _strip_thinking("  plain answer  ") == "plain answer"
+
+    async def _collect_stream(self, chat_service, tokens, matter_id=None):
+        chat_service.llm = _FakeStreamingLLM(tokens)
+        contents = []
+        async for event in chat_service.stream_chat(matter_id or uuid4(), "question"):
+            if event["event"] == "message":
+                contents.append(orjson.loads(event["data"])["content"])
+        return "".join(contents)
+
+    @pytest.mark.asyncio
+    async def test_stream_filters_think_block_split_across_tokens(self, chat_service):
+        # The close tag straddles token boundaries; the scanner backs up by
+        # len("</think>") - 1 before searching, so the split tag is found.
+        tokens = ["<think>let me rea", "son</thi", "nk> The answer", " is 42."]
+        assert await self._collect_stream(chat_service, tokens) == " The answer is 42."
+
+    @pytest.mark.asyncio
+    async def test_stream_think_block_within_single_token(self, chat_service):
+        tokens = ["<think>hmm</think>Answer", " here."]
+        assert await self._collect_stream(chat_service, tokens) == "Answer here."
+
+    @pytest.mark.asyncio
+    async def test_stream_without_think_passes_through(self, chat_service):
+        tokens = ["Hello", " ", "world"]
+        assert await self._collect_stream(chat_service, tokens) == "Hello world"
+
+    @pytest.mark.asyncio
+    async def test_stream_text_before_think_tag_is_kept(self, chat_service):
+        tokens = ["Intro <think>reasoning", " more</think>", " outro"]
+        assert await self._collect_stream(chat_service, tokens) == "Intro  outro"
+
+    @pytest.mark.asyncio
+    async def test_streamed_history_records_filtered_response(self, chat_service):
+        matter_id = uuid4()
+        tokens = ["<think>secret</think>", "Visible answer"]
+        await self._collect_stream(chat_service, tokens, matter_id=matter_id)
+        messages = history.get(matter_id)
+        assert messages[-1].role == "assistant"
+        assert messages[-1].content == "Visible answer"
@@ -0,0 +1,65 @@
+"""Tests for the query-embedding micro-batcher."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.llm import embed_batcher
+
+
+class _FakeEmbeddings:
+    def __init__(self):
+        self.calls = []
+
+    async def aembed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.fixture(autouse=True)
+def reset_batcher():
+    # Each test gets a fresh queue/worker bound to its own event loop.
+    embed_batcher._queue = None
+    if embed_batcher._worker is not None:
+        embed_batcher._worker.cancel()
+    embed_batcher._worker = None
+    yield
+    embed_batcher._queue = None
+    if embed_batcher._worker is not None:
+        embed_batcher._worker.cancel()
+    embed_batcher._worker = None
+
+
+class TestEmbedBatcher:
+    @pytest.mark.asyncio
+    async def test_single_query_embeds(self):
+        fake = _FakeEmbeddings()
+        with patch("src.llm.embed_batcher.get_embeddings", return_value=fake):
+            result = await embed_batcher.embed_query("abc")
+        assert result == [3.0]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_coalesce_into_one_call(self):
+        fake = _FakeEmbeddings()
+        with patch("src.llm.embed_batcher.get_embeddings", return_value=fake):
+            results = await asyncio.gather(
+                embed_batcher.embed_query("a"),
+                embed_batcher.embed_query("bb"),
+                embed_batcher.embed_query("ccc"),
+            )
+        # One batched provider call, results matched back by position.
+        assert len(fake.calls) == 1
+        assert sorted(fake.calls[0]) == ["a", "bb", "ccc"]
+        assert results == [[1.0], [2.0], [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_provider_failure_propagates_and_worker_survives(self):
+        failing = AsyncMock()
+        failing.aembed_documents.side_effect = RuntimeError("provider down")
+        with patch("src.llm.embed_batcher.get_embeddings", return_value=failing):
+            with pytest.raises(RuntimeError, match="provider down"):
+                await embed_batcher.embed_query("a")
+
+        fake = _FakeEmbeddings()
+        with patch("src.llm.embed_batcher.get_embeddings", return_value=fake):
+            assert await embed_batcher.embed_query("bb") == [2.0]
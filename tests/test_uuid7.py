@@ -0,0 +1,29 @@
+"""Tests for the time-ordered UUIDv7 generator."""
+import time
+import uuid
+
+from src.shared.models import uuid7
+
+
+class TestUuid7:
+    def test_version_and_variant_bits(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_timestamp_prefix_matches_clock(self):
+        before_ms = time.time_ns() // 1_000_000
+        value = uuid7()
+        after_ms = time.time_ns() // 1_000_000
+        embedded_ms = int.from_bytes(value.bytes[:6], "big")
+        assert before_ms <= embedded_ms <= after_ms
+
+    def test_sorts_by_generation_time(self):
+        first = uuid7()
+        time.sleep(0.002)  # cross a millisecond boundary
+        second = uuid7()
+        assert first.bytes < second.bytes
+
+    def test_uniqueness(self):
+        values = {uuid7() for _ in range(1000)}
+        assert len(values) == 1000